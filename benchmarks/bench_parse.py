@@ -0,0 +1,78 @@
+"""Parse time and peak memory of the JSON and XML response paths.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parse [artists] [albums]
+"""
+import sys
+import time
+import tracemalloc
+
+from custom_components.subsonic.models import Album, Artist
+from custom_components.subsonic.responseHelper import SubsonicResponse, getGroupedRecords, getRecords
+from custom_components.subsonic.xmlHelper import XmlStreamParser, XmlTags
+
+from .payloads import albumListContainer, artistsContainer, toJson, toXml
+
+CHUNK_SIZE = 64 * 1024
+ROUNDS = 3
+
+
+def parseArtists(response: SubsonicResponse) -> list:
+    return getGroupedRecords(response.decode(), "index", "artist", Artist, "index")
+
+
+def parseAlbums(response: SubsonicResponse) -> list:
+    return getRecords(response.decode(), "album", Album)
+
+
+def streamAlbums(body: bytes) -> list:
+    parser = XmlStreamParser("album")
+    tags = XmlTags({tag: [] for tag in parser.tags})
+
+    for offset in range(0, len(body), CHUNK_SIZE):
+        for tag, attrs in parser.feed(body[offset:offset + CHUNK_SIZE]):
+            tags[tag].append(attrs)
+
+    for tag, attrs in parser.close():
+        tags[tag].append(attrs)
+
+    return getRecords(tags, "album", Album)
+
+
+def measure(parse, *args) -> tuple[float, int, int]:
+    elapsed = []
+
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = parse(*args)
+        elapsed.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = parse(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return min(elapsed) * 1000, peak, len(result)
+
+
+def report(name: str, body: bytes, parse, *args) -> None:
+    ms, peak, items = measure(parse, *args)
+    print(f"{name:<24} {len(body) / 1024 / 1024:8.1f} MB {items:8} items {ms:9.1f} ms {peak / 1024 / 1024:9.1f} MB peak")
+
+
+def main(artists: int = 20_000, albums: int = 60_000) -> None:
+    artistsBodies = {"json": toJson(artistsContainer(artists)), "xml": toXml(artistsContainer(artists))}
+    albumsBodies = {"json": toJson(albumListContainer(albums)), "xml": toXml(albumListContainer(albums))}
+
+    for responseFormat, body in artistsBodies.items():
+        report(f"getArtists {responseFormat}", body, parseArtists, SubsonicResponse("getArtists", body, responseFormat == "json"))
+
+    for responseFormat, body in albumsBodies.items():
+        report(f"getAlbumList2 {responseFormat}", body, parseAlbums, SubsonicResponse("getAlbumList2", body, responseFormat == "json"))
+
+    report("getAlbumList2 xml stream", albumsBodies["xml"], streamAlbums, albumsBodies["xml"])
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
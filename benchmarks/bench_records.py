@@ -0,0 +1,39 @@
+"""Memory of slotted records compared with the plain attribute dicts.
+
+Each song dict is copied the way the response helpers produce it, so no
+strings are shared with the payload generator. Run from the repository root::
+
+    python -m benchmarks.bench_records [songs]
+"""
+import json
+import sys
+import tracemalloc
+
+from custom_components.subsonic.models import Album, Song
+
+from .payloads import album, song
+
+
+def measure(build) -> tuple[int, list]:
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return size, result
+
+
+def main(songs: int = 60_000) -> None:
+    songBodies = [json.dumps(song(i)) for i in range(songs)]
+    albumBodies = [json.dumps(album(i)) for i in range(songs // 12)]
+
+    for name, bodies, recordType in (("songs", songBodies, Song), ("albums", albumBodies, Album)):
+        dictSize, _ = measure(lambda: [json.loads(body) for body in bodies])
+        recordSize, _ = measure(lambda: [recordType.fromDict(json.loads(body)) for body in bodies])
+
+        print(f"{len(bodies):7} {name:<7} dict {dictSize / 1024 / 1024:8.1f} MB"
+              f"   record {recordSize / 1024 / 1024:8.1f} MB   ({recordSize / dictSize:.0%})")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,82 @@
+"""Latency of resolving a 200-track queue, with and without the song index.
+
+A local aiohttp server answers getAlbum and getSong after a fixed delay that
+stands in for the network round trip. Run from the repository root::
+
+    python -m benchmarks.bench_resolve [latencyMs]
+"""
+import asyncio
+import sys
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.subsonic.const import STREAM_PROFILE_DEFAULT
+from custom_components.subsonic.subsonicApi import SubsonicApi
+
+from .payloads import song
+
+QUEUE_SIZE = 200
+SONGS_PER_ALBUM = 12
+
+
+def makeApp(latency: float) -> web.Application:
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        endpoint = request.match_info["endpoint"]
+
+        if endpoint == "getAlbum":
+            first = int(request.query["id"].removeprefix("al-")) * SONGS_PER_ALBUM
+            payload = {"album": {"id": request.query["id"], "name": "Album",
+                                 "song": [song(i) for i in range(first, first + SONGS_PER_ALBUM)]}}
+        elif endpoint == "getSong":
+            payload = {"song": song(int(request.query["id"].removeprefix("tr-")))}
+        else:
+            payload = {}
+
+        return web.json_response({"subsonic-response": {"status": "ok", "version": "1.16.1", **payload}})
+
+    app = web.Application()
+    app.router.add_get("/rest/{endpoint}.view", handler)
+    return app
+
+
+async def resolve(api: SubsonicApi, songId: str) -> tuple[str, str]:
+    song = await api.getSongInfo(songId)
+    return api.getSongStreamUrl(songId), api.getStreamContentType(STREAM_PROFILE_DEFAULT, song)
+
+
+async def resolveQueue(api: SubsonicApi, songIds: list[str]) -> float:
+    start = time.perf_counter()
+
+    for songId in songIds:
+        await resolve(api, songId)
+
+    return (time.perf_counter() - start) * 1000
+
+
+async def main(latencyMs: float = 20) -> None:
+    server = TestServer(makeApp(latencyMs / 1000))
+    await server.start_server()
+    config = {"url": str(server.make_url("")).rstrip("/"), "user": "user", "password": "password"}
+    songIds = [f"tr-{i}" for i in range(QUEUE_SIZE)]
+
+    try:
+        api = SubsonicApi(userAgent="benchmark", config=config, cache=None)
+        print(f"getSong per track   {await resolveQueue(api, songIds):9.1f} ms")
+        await api.close()
+
+        api = SubsonicApi(userAgent="benchmark", config=config, cache=None)
+
+        for albumId in range(QUEUE_SIZE // SONGS_PER_ALBUM + 1):
+            await api.getAlbum(f"al-{albumId}")
+
+        print(f"song index          {await resolveQueue(api, songIds):9.1f} ms")
+        await api.close()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(float(arg) for arg in sys.argv[1:2])))
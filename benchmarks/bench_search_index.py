@@ -0,0 +1,69 @@
+"""Build time, memory and query latency of the local search index at 100k tracks.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_search_index [tracks]
+"""
+import sys
+import time
+import tracemalloc
+
+from custom_components.subsonic.const import SEARCH_INDEX_MAX_ENTRIES, SEARCH_PAGE_SIZE
+from custom_components.subsonic.models import Album, Artist, Song
+from custom_components.subsonic.searchIndex import SearchIndex
+
+from .payloads import album, artist, song
+
+QUERIES = ("artist 42", "album 1234", "track 99999", "art 7", "tr", "missing")
+ROUNDS = 100
+
+
+def build(artists: list, albums: list, songs: list) -> SearchIndex:
+    index = SearchIndex(SEARCH_INDEX_MAX_ENTRIES)
+    index.update("artist", artists)
+    index.update("album", albums)
+    index.add("song", songs)
+
+    return index
+
+
+def main(tracks: int = 100_000) -> None:
+    songs = [Song.fromDict(song(i)) for i in range(tracks)]
+    albums = [Album.fromDict(album(i)) for i in range(tracks // 12 + 1)]
+    artists = [Artist.fromDict(artist(i)) for i in range(tracks // 120 + 1)]
+
+    tracemalloc.start()
+    index = build(artists, albums, songs)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    build(artists, albums, songs)
+    built = time.perf_counter() - start
+
+    print(f"{len(index)} entries, built in {built * 1000:.0f} ms, {size / 1024 / 1024:.1f} MB")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+
+        for _ in range(ROUNDS):
+            result = index.search(query, SEARCH_PAGE_SIZE)
+
+        elapsed = (time.perf_counter() - start) / ROUNDS
+        print(f"  {query!r:<14} {elapsed * 1000:8.3f} ms  {len(result):3} results")
+
+    timed("sync without changes", lambda: index.update("album", albums))
+    renamed = [Album.fromDict({**album(i), "name": f"Remaster {i}"}) for i in range(100)]
+    timed("sync renaming 100 albums", lambda: index.update("album", renamed + albums[100:]))
+    browsed = [Song.fromDict({**song(i), "title": f"Bonus {i}"}) for i in range(tracks, tracks + 12)]
+    timed("album browse adding 12 new songs", lambda: index.add("song", browsed))
+    timed("query after the browse", lambda: index.search("bonus", SEARCH_PAGE_SIZE))
+
+
+def timed(name: str, action) -> None:
+    start = time.perf_counter()
+    action()
+    print(f"{name:<34} {(time.perf_counter() - start) * 1000:8.3f} ms")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
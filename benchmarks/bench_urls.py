@@ -0,0 +1,65 @@
+"""Time to build 10k stream and cover URLs.
+
+The baseline hashes a fresh token per URL and joins the parameters without
+encoding, which is what getSongStreamUrl did before UrlBuilder. Run from the
+repository root::
+
+    python -m benchmarks.bench_urls [count]
+"""
+import hashlib
+import secrets
+import sys
+import time
+from unittest.mock import MagicMock
+
+from custom_components.subsonic.const import COVER_THUMBNAIL_SIZE
+from custom_components.subsonic.coverCache import CoverArtCache
+from custom_components.subsonic.subsonicApi import SubsonicApi
+
+ROUNDS = 5
+
+
+def baselineUrl(api: SubsonicApi, endpoint: str, id: str) -> str:
+    salt = secrets.token_hex(5)
+    params = {
+        "u": api.user,
+        "t": hashlib.md5(f"{api.password}{salt}".encode()).hexdigest(),
+        "s": salt,
+        "v": api.apiVersion,
+        "c": "HomeAssistant",
+        "id": id,
+    }
+
+    return f"{api.url}/rest/{endpoint}.view?" + "&".join(f"{k}={v}" for k, v in params.items())
+
+
+def measure(build) -> float:
+    elapsed = []
+
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        build()
+        elapsed.append(time.perf_counter() - start)
+
+    return min(elapsed) * 1000
+
+
+def main(count: int = 10_000) -> None:
+    api = SubsonicApi(userAgent="benchmark",
+                      config={"url": "http://localhost:4533", "user": "user name", "password": "password"})
+    hass = MagicMock()
+    coverCache = CoverArtCache(hass, api, "entry")
+    ids = [f"tr-{i}" for i in range(count)]
+
+    results = {
+        "baseline stream": lambda: [baselineUrl(api, "stream", id) for id in ids],
+        "getSongStreamUrl": lambda: [api.getSongStreamUrl(id) for id in ids],
+        "CoverArtCache.getUrls": lambda: coverCache.getUrls(ids, COVER_THUMBNAIL_SIZE),
+    }
+
+    for name, build in results.items():
+        print(f"{count} x {name:<22} {measure(build):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,93 @@
+"""Synthetic Subsonic payloads shaped like a large Navidrome library."""
+import json
+from xml.sax.saxutils import quoteattr
+
+RESPONSE_ATTRIBUTES = {"status": "ok", "version": "1.16.1"}
+
+
+def song(i: int) -> dict:
+    return {
+        "id": f"tr-{i}",
+        "parent": f"al-{i // 12}",
+        "isDir": False,
+        "title": f"Track {i}",
+        "album": f"Album {i // 12}",
+        "artist": f"Artist {i // 120}",
+        "track": i % 12 + 1,
+        "year": 1970 + i % 50,
+        "genre": "Rock",
+        "coverArt": f"al-{i // 12}",
+        "size": 8_000_000 + i,
+        "contentType": "audio/flac",
+        "suffix": "flac",
+        "duration": 180 + i % 240,
+        "bitRate": 900,
+        "path": f"Artist {i // 120}/Album {i // 12}/{i % 12 + 1:02} Track {i}.flac",
+        "created": "2024-01-01T00:00:00.000Z",
+        "albumId": f"al-{i // 12}",
+        "artistId": f"ar-{i // 120}",
+        "type": "music",
+    }
+
+
+def album(i: int) -> dict:
+    return {
+        "id": f"al-{i}",
+        "name": f"Album {i}",
+        "artist": f"Artist {i // 10}",
+        "artistId": f"ar-{i // 10}",
+        "coverArt": f"al-{i}",
+        "songCount": 12,
+        "duration": 2880,
+        "created": "2024-01-01T00:00:00.000Z",
+        "year": 1970 + i % 50,
+        "genre": "Rock",
+    }
+
+
+def artist(i: int) -> dict:
+    return {
+        "id": f"ar-{i}",
+        "name": f"{chr(65 + i % 26)}rtist {i}",
+        "coverArt": f"ar-{i}",
+        "albumCount": 10,
+    }
+
+
+def artistsContainer(count: int) -> dict:
+    index: dict[str, list] = {}
+
+    for i in range(count):
+        item = artist(i)
+        index.setdefault(item["name"][0], []).append(item)
+
+    return {"artists": {"ignoredArticles": "The", "index": [
+        {"name": name, "artist": items} for name, items in sorted(index.items())
+    ]}}
+
+
+def albumListContainer(count: int) -> dict:
+    return {"albumList2": {"album": [album(i) for i in range(count)]}}
+
+
+def toJson(container: dict) -> bytes:
+    return json.dumps({"subsonic-response": {**RESPONSE_ATTRIBUTES, **container}}).encode()
+
+
+def toXml(container: dict) -> bytes:
+    attributes = " ".join(f"{k}={quoteattr(str(v))}" for k, v in RESPONSE_ATTRIBUTES.items())
+    body = "".join(_element(k, v) for k, v in container.items())
+
+    return (f'<?xml version="1.0" encoding="UTF-8"?>'
+            f'<subsonic-response xmlns="http://subsonic.org/restapi" {attributes}>{body}</subsonic-response>').encode()
+
+
+def _element(name: str, node) -> str:
+    if isinstance(node, list):
+        return "".join(_element(name, item) for item in node)
+
+    attributes = " ".join(f"{k}={quoteattr(str(v).lower() if isinstance(v, bool) else str(v))}"
+                          for k, v in node.items() if not isinstance(v, (list, dict)))
+    children = "".join(_element(k, v) for k, v in node.items() if isinstance(v, (list, dict)))
+
+    return f"<{name} {attributes}>{children}</{name}>"
@@ -1,34 +1,92 @@
-from .const import DOMAIN, LOGGER
+from .const import COVER_VIEW_REGISTERED, DOMAIN, LIBRARY_STORAGE_VERSION, LOGGER
+from .coordinator import SubsonicCoordinator
+from .coverCache import CoverArtCache
+from .data import SubsonicData
+from .library import SubsonicLibrary
+from .prefetch import SubsonicPrefetcher
+from .services import async_setup_services
 from .subsonicApi import SubsonicApi
+from .view import SubsonicCoverView
 
-from homeassistant.const import __version__
+from homeassistant.const import Platform, __version__
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+
+PLATFORMS = [Platform.SENSOR]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
-    result = False
-    session = async_get_clientsession(hass)
     userAgent = f"Home Assistant/{__version__}"
 
     LOGGER.info(f"Subsonic Setup")
 
-    navidrome = SubsonicApi(session=session, 
-                            userAgent=userAgent,
-                            config=entry.data)
+    navidrome = SubsonicApi(userAgent=userAgent,
+                            config=entry.data,
+                            executor=hass.async_add_executor_job)
 
     try:
         result = await navidrome.ping()
-    except Exception as e:
+    except Exception as err:
+        await navidrome.close()
         raise ConfigEntryNotReady("Could not connect to Subsonic API") from err
-    
-    hass.data[DOMAIN] = navidrome
-    return result
+
+    if not result:
+        await navidrome.close()
+        raise ConfigEntryNotReady("Subsonic API rejected the ping")
+
+    library = SubsonicLibrary(hass, navidrome, entry.entry_id)
+    coverCache = CoverArtCache(hass, navidrome, entry.entry_id)
+    coordinator = SubsonicCoordinator(hass, library)
+    prefetcher = SubsonicPrefetcher(hass, navidrome, entry)
+
+    # Browsing reads the synced snapshot, so keep the coordinator polling
+    # even though no entity listens to it.
+    entry.async_on_unload(coordinator.async_add_listener(lambda: None))
+    entry.async_create_background_task(hass,
+                                       coordinator.async_refresh(),
+                                       f"{DOMAIN} library sync")
+
+    if not hass.data.get(COVER_VIEW_REGISTERED):
+        hass.http.register_view(SubsonicCoverView(hass))
+        hass.data[COVER_VIEW_REGISTERED] = True
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = SubsonicData(api=navidrome,
+                                                                    library=library,
+                                                                    coverCache=coverCache,
+                                                                    coordinator=coordinator,
+                                                                    prefetcher=prefetcher)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    del hass.data[DOMAIN]
-    return True
\ No newline at end of file
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+
+    data: SubsonicData = hass.data[DOMAIN].pop(entry.entry_id)
+    data.prefetcher.cancel()
+    await data.coordinator.async_shutdown()
+    await data.api.close()
+
+    if len(hass.data[DOMAIN]) == 0:
+        del hass.data[DOMAIN]
+
+    return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cover cache and library snapshot of a removed entry."""
+    await hass.async_add_executor_job(CoverArtCache.removeDirectory, hass, entry.entry_id)
+    await Store(hass, LIBRARY_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.library").async_remove()
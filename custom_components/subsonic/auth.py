@@ -0,0 +1,50 @@
+import hashlib
+import secrets
+import time
+
+
+class TokenProvider:
+    """Hands out Subsonic auth parameters without hashing on every call.
+
+    A pool of salt/token pairs is computed once per validity window and
+    served round-robin. When an OpenSubsonic API key is configured it is
+    used instead of token authentication.
+    """
+
+    def __init__(self,
+                 user: str,
+                 password: str,
+                 validity: float,
+                 poolSize: int,
+                 apiKey: str | None = None) -> None:
+        self.user = user
+        self.password = password
+        self.validity = validity
+        self.poolSize = poolSize
+        self.apiKey = apiKey or None
+        self.generated = 0
+        self.__pool: list[dict] = []
+        self.__poolCreated = 0.0
+        self.__next = 0
+
+    def getAuthParams(self) -> dict:
+        if self.apiKey is not None:
+            return {"apiKey": self.apiKey}
+
+        now = time.monotonic()
+
+        if len(self.__pool) == 0 or now - self.__poolCreated >= self.validity:
+            self.__pool = [self.__generate(secrets.token_hex(5)) for _ in range(self.poolSize)]
+            self.__poolCreated = now
+
+        self.__next = (self.__next + 1) % len(self.__pool)
+        return self.__pool[self.__next]
+
+    def __generate(self, salt: str) -> dict:
+        self.generated += 1
+
+        return {
+            "u": self.user,
+            "t": hashlib.md5((self.password + salt).encode()).hexdigest(),
+            "s": salt
+        }
@@ -0,0 +1,143 @@
+import asyncio
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+from .const import CACHE_DEFAULT_TTL, CACHE_MAX_ENTRIES, CACHE_TTL
+
+
+class ResponseCache:
+    """TTL + LRU cache for parsed API results.
+
+    Concurrent lookups of the same key share a single in-flight load.
+    """
+
+    def __init__(self,
+                 maxEntries: int = CACHE_MAX_ENTRIES,
+                 ttl: dict[str, float] = CACHE_TTL,
+                 defaultTtl: float = CACHE_DEFAULT_TTL) -> None:
+        self.maxEntries = maxEntries
+        self.ttl = ttl
+        self.defaultTtl = defaultTtl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.endpointStats: dict[str, dict[str, int]] = {}
+        self.__entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self.__inflight: dict[tuple, asyncio.Task] = {}
+        self.__generation = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def peek(self, endpoint: str, params: tuple = ()) -> Any:
+        entry = self.__entries.get((endpoint, params))
+
+        if entry is None or entry[0] < time.monotonic():
+            return None
+
+        return entry[1]
+
+    async def get(self, endpoint: str, params: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        key = (endpoint, params)
+        entry = self.__entries.get(key)
+
+        if entry is not None:
+            if entry[0] >= time.monotonic():
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                self.__count(endpoint, "hits")
+                return entry[1]
+
+            del self.__entries[key]
+
+        task = self.__inflight.get(key)
+
+        if task is None:
+            self.misses += 1
+            self.__count(endpoint, "misses")
+            task = asyncio.create_task(self.__load(key, loader))
+            task.add_done_callback(self.__retrieveException)
+            self.__inflight[key] = task
+        else:
+            self.coalesced += 1
+            self.__count(endpoint, "coalesced")
+
+        return await asyncio.shield(task)
+
+    def hitRatio(self, endpoint: str | None = None) -> float:
+        if endpoint is None:
+            hits, lookups = self.hits + self.coalesced, self.hits + self.misses + self.coalesced
+        else:
+            stats = self.endpointStats.get(endpoint, {})
+            hits = stats.get("hits", 0) + stats.get("coalesced", 0)
+            lookups = hits + stats.get("misses", 0)
+
+        return hits / lookups if lookups > 0 else 0.0
+
+    def set(self, endpoint: str, params: tuple, value: Any) -> None:
+        key = (endpoint, params)
+        expires = time.monotonic() + self.ttl.get(endpoint, self.defaultTtl)
+
+        self.__entries[key] = (expires, value)
+        self.__entries.move_to_end(key)
+
+        while len(self.__entries) > self.maxEntries:
+            self.__entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        self.__generation += 1
+
+        if endpoint is None:
+            self.__entries.clear()
+            return
+
+        for key in [k for k in self.__entries if k[0] == endpoint]:
+            del self.__entries[key]
+
+    def __count(self, endpoint: str, kind: str) -> None:
+        stats = self.endpointStats.setdefault(endpoint, {"hits": 0, "misses": 0, "coalesced": 0})
+        stats[kind] += 1
+
+    async def __load(self, key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        generation = self.__generation
+
+        try:
+            value = await loader()
+        finally:
+            self.__inflight.pop(key, None)
+
+        if generation == self.__generation:
+            self.set(key[0], key[1], value)
+
+        return value
+
+    @staticmethod
+    def __retrieveException(task: asyncio.Task) -> None:
+        if not task.cancelled():
+            task.exception()
+
+
+def cached(endpoint: str):
+    """Serve an API method from its owner's ``cache`` when one is set."""
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache: ResponseCache | None = getattr(self, "cache", None)
+
+            if cache is None:
+                return await func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = tuple(bound.arguments.values())[1:]
+
+            return await cache.get(endpoint, params, lambda: func(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,6 @@
 from typing import Any
 import voluptuous as vol
-from .const import DOMAIN, TITLE, LOGGER
+from .const import DOMAIN, TITLE, LOGGER, STREAM_PROFILE_DEFAULT, STREAM_PROFILES
 from .subsonicApi import SubsonicApi
 from homeassistant.core import callback
 from homeassistant import config_entries
@@ -13,9 +13,9 @@ class SubsonicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def validate_input(self, config: dict) -> bool:
         userAgent = "HomeAssistant"
         
-        api = SubsonicApi(userAgent=userAgent, config=config)
-        if not await api.ping():
-            return False
+        async with SubsonicApi(userAgent=userAgent, config=config) as api:
+            if not await api.ping():
+                return False
         return True
 
     async def async_step_user(self, user_input=None, error=None):
@@ -24,6 +24,7 @@ class SubsonicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Required("url"): str,
             vol.Required("user"): str,
             vol.Required("password"): str,
+            vol.Optional("api_key", default=""): str,
             vol.Required("app"): vol.In({
                 "subsonic": "Subsonic",
                 "navidrome": "Navidrome"
@@ -39,6 +40,7 @@ class SubsonicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "url": user_input["url"],
                 "user": user_input["user"],
                 "password": user_input["password"],
+                "api_key": user_input.get("api_key", ""),
                 "app": app,
                 "title": title
             }
@@ -49,6 +51,8 @@ class SubsonicConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "playlists": True,
                 "genres": True,
                 "radio": True,
+                "stream_profile": STREAM_PROFILE_DEFAULT,
+                "prefetch": False,
             }
 
             if await self.validate_input(data):
@@ -81,6 +85,10 @@ class SubsonicOptionsFlow(config_entries.OptionsFlow):
                     vol.Optional("playlists", default=self.entry.options.get("playlists", True)): bool,
                     vol.Optional("genres", default=self.entry.options.get("genres", True)): bool,
                     vol.Optional("radio", default=self.entry.options.get("radio", False)): bool,
+                    vol.Optional("stream_profile", default=self.entry.options.get("stream_profile", STREAM_PROFILE_DEFAULT)): vol.In({
+                        profile: values["name"] for profile, values in STREAM_PROFILES.items()
+                    }),
+                    vol.Optional("prefetch", default=self.entry.options.get("prefetch", False)): bool,
                 }
             ),
         )
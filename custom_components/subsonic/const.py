@@ -1,11 +1,92 @@
 import logging
+from datetime import timedelta
 from typing import Final
 
 DOMAIN: Final = "subsonic"
+CLIENT_NAME: Final = "HomeAssistant"
 
 LOGGER = logging.getLogger(__package__)
 
 TITLE: Final = {
     "subsonic": "Subsonic",
     "navidrome": "Navidrome"
-}
\ No newline at end of file
+}
+
+MAX_CONNECTIONS: Final = 8
+DNS_CACHE_TTL: Final = 300
+KEEP_ALIVE_TIMEOUT: Final = 60.0
+
+MAX_RETRIES: Final = 3
+MAX_TIMEOUT_RETRIES: Final = 1
+RETRY_BACKOFF: Final = 0.25
+RETRY_MAX_BACKOFF: Final = 4.0
+RETRY_BUDGET_RATIO: Final = 0.2
+RETRY_BUDGET_CAPACITY: Final = 10.0
+CIRCUIT_FAILURE_THRESHOLD: Final = 5
+CIRCUIT_RESET_TIMEOUT: Final = 30.0
+
+ALBUM_PAGE_SIZE: Final = 500
+MAX_CONCURRENT_PAGES: Final = 4
+GENRE_PAGE_SIZE: Final = 100
+BROWSE_PAGE_SIZE: Final = 100
+ARTIST_BUCKET_OTHER: Final = "other"
+ARTIST_BUCKET_OTHER_TITLE: Final = "#"
+SONG_INDEX_MAX_ENTRIES: Final = 20000
+RADIO_INDEX_TTL: Final = 600
+SEARCH_PAGE_SIZE: Final = 20
+SEARCH_DEBOUNCE: Final = 0.3
+SEARCH_INDEX_MAX_ENTRIES: Final = 150000
+SERVICE_SEARCH: Final = "search"
+SERVER_BROWSE_TIMEOUT: Final = 10
+PREFETCH_CHILDREN: Final = 4
+PREFETCH_CONCURRENCY: Final = 2
+PREFETCH_BYTE_BUDGET: Final = 8 * 1024 * 1024
+PREFETCH_BUDGET_PERIOD: Final = 15 * 60
+PREFETCH_HISTORY_SIZE: Final = 200
+
+CACHE_MAX_ENTRIES: Final = 256
+CACHE_DEFAULT_TTL: Final = 300
+CACHE_TTL: Final = {
+    "getArtists": 3600,
+    "getArtist": 1800,
+    "getGenres": 3600,
+    "getAlbumList2": 1800,
+    "getAlbum": 1800,
+    "getSongsByGenre": 900,
+    "getSong": 1800,
+    "getPlaylists": 60,
+    "getPlaylist": 60,
+    "getInternetRadioStations": 600,
+    "search3": 300
+}
+
+LIBRARY_STORAGE_VERSION: Final = 1
+LIBRARY_SYNC_INTERVAL: Final = timedelta(minutes=15)
+TOKEN_VALIDITY: Final = 15 * 60
+TOKEN_POOL_SIZE: Final = 8
+
+COVER_VIEW_REGISTERED: Final = f"{DOMAIN}_cover_view"
+COVER_VIEW_URL: Final = "/api/subsonic/cover/{entryId}/{coverId}"
+COVER_THUMBNAIL_SIZE: Final = 300
+COVER_CACHE_DIR: Final = ".cache"
+COVER_CACHE_MAX_BYTES: Final = 200 * 1024 * 1024
+COVER_CACHE_MAX_AGE: Final = 7 * 24 * 60 * 60
+
+STREAM_PROFILE_DEFAULT: Final = "lossless"
+STREAM_PROFILES: Final = {
+    "lossless": {
+        "name": "Original (lossless)",
+        "params": {"format": "raw"},
+        "contentType": None
+    },
+    "mp3_320": {
+        "name": "MP3 320 kbps",
+        "params": {"format": "mp3", "maxBitRate": 320, "estimateContentLength": "true"},
+        "contentType": "audio/mpeg"
+    },
+    "opus_128": {
+        "name": "Opus 128 kbps",
+        "params": {"format": "opus", "maxBitRate": 128, "estimateContentLength": "true"},
+        "contentType": "audio/ogg"
+    }
+}
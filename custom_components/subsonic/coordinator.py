@@ -0,0 +1,33 @@
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN, LIBRARY_SYNC_INTERVAL, LOGGER
+from .library import SubsonicLibrary
+
+
+class SubsonicCoordinator(DataUpdateCoordinator[SubsonicLibrary]):
+    """Periodically syncs the library snapshot in the background."""
+
+    def __init__(self, hass: HomeAssistant, library: SubsonicLibrary) -> None:
+        super().__init__(hass,
+                         LOGGER,
+                         name=f"{DOMAIN} library",
+                         update_interval=LIBRARY_SYNC_INTERVAL)
+        self.library = library
+        self.api = library.api
+
+    async def _async_update_data(self) -> SubsonicLibrary:
+        await self.library.async_ensure_loaded()
+
+        try:
+            scanStatus = await self.api.getScanStatus()
+
+            if str(scanStatus.get("scanning", False)).lower() == "true":
+                LOGGER.debug("Server is scanning, postponing library sync")
+                return self.library
+
+            await self.library.async_revalidate()
+        except Exception as e:
+            raise UpdateFailed(f"Could not sync library: {e}") from e
+
+        return self.library
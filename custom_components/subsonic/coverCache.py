@@ -0,0 +1,188 @@
+import asyncio
+import hashlib
+import hmac
+import mimetypes
+import os
+import shutil
+from collections import OrderedDict
+from urllib.parse import quote
+from homeassistant.core import HomeAssistant
+
+from .const import COVER_CACHE_DIR, COVER_CACHE_MAX_BYTES, COVER_VIEW_URL, DOMAIN, LOGGER
+from .subsonicApi import SubsonicApi
+
+
+class CoverArtCache:
+    """Disk cache of resized cover art, evicted by total size in LRU order."""
+
+    def __init__(self,
+                 hass: HomeAssistant,
+                 api: SubsonicApi,
+                 entryId: str,
+                 maxBytes: int = COVER_CACHE_MAX_BYTES) -> None:
+        self.hass = hass
+        self.api = api
+        self.entryId = entryId
+        self.maxBytes = maxBytes
+        self.directory = CoverArtCache.getDirectory(hass, entryId)
+        self.totalBytes = 0
+        self.__secret = hashlib.sha256(f"{entryId}:{api.password}:{api.apiKey}".encode()).digest()
+        self.__files: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self.__inflight: dict[str, asyncio.Task] = {}
+        self.__lock = asyncio.Lock()
+        self.__loaded = False
+
+    @staticmethod
+    def getDirectory(hass: HomeAssistant, entryId: str) -> str:
+        return hass.config.path(COVER_CACHE_DIR, DOMAIN, "covers", entryId)
+
+    @staticmethod
+    def removeDirectory(hass: HomeAssistant, entryId: str) -> None:
+        shutil.rmtree(CoverArtCache.getDirectory(hass, entryId), ignore_errors=True)
+        CoverArtCache.__removeLegacyDirectory(hass, entryId)
+
+    @staticmethod
+    def __removeLegacyDirectory(hass: HomeAssistant, entryId: str) -> None:
+        # Covers used to be cached under .storage, which ends up in backups.
+        shutil.rmtree(hass.config.path(".storage", f"{DOMAIN}_covers", entryId), ignore_errors=True)
+
+    def sign(self, coverId: str) -> str:
+        return hmac.new(self.__secret, coverId.encode(), hashlib.sha256).hexdigest()[:16]
+
+    def verify(self, coverId: str, signature: str) -> bool:
+        return hmac.compare_digest(self.sign(coverId), signature)
+
+    def getUrls(self, coverIds: list[str], size: int | None = None) -> list[str]:
+        prefix = COVER_VIEW_URL.format(entryId=self.entryId, coverId="")
+        sizeQuery = "" if size is None else f"size={size}&"
+
+        return [
+            f"{prefix}{quote(coverId, safe='')}?{sizeQuery}sig={self.sign(coverId)}"
+            for coverId in coverIds
+        ]
+
+    @staticmethod
+    def getKey(coverId: str, size: int | None) -> str:
+        return hashlib.sha1(f"{coverId}:{size}".encode()).hexdigest()
+
+    async def async_get(self, coverId: str, size: int | None = None) -> tuple[bytes, str, str] | None:
+        """Return (content, content type, etag) for a cover."""
+        await self.__async_load()
+        key = self.getKey(coverId, size)
+
+        if key in self.__files:
+            self.__files.move_to_end(key)
+            fileName, fileSize = self.__files[key]
+            content = await self.hass.async_add_executor_job(self.__read, fileName)
+
+            if content is not None:
+                return content, self.__contentType(fileName), f'"{key}-{fileSize}"'
+
+            self.__forget(key)
+
+        task = self.__inflight.get(key)
+
+        if task is None:
+            task = asyncio.create_task(self.__async_fetch(key, coverId, size))
+            self.__inflight[key] = task
+
+        return await asyncio.shield(task)
+
+    async def __async_fetch(self, key: str, coverId: str, size: int | None) -> tuple[bytes, str, str] | None:
+        try:
+            return await self.__async_download(key, coverId, size)
+        finally:
+            self.__inflight.pop(key, None)
+
+    async def __async_download(self, key: str, coverId: str, size: int | None) -> tuple[bytes, str, str] | None:
+        cover = await self.api.getCoverArt(coverId, size)
+
+        if cover is None:
+            return None
+
+        content, contentType = cover
+        extension = mimetypes.guess_extension(contentType.split(";")[0].strip()) or ".img"
+        fileName = f"{key}{extension}"
+
+        await self.hass.async_add_executor_job(self.__write, fileName, content)
+        self.__files[key] = (fileName, len(content))
+        self.totalBytes += len(content)
+
+        await self.__async_evict()
+
+        return content, contentType, f'"{key}-{len(content)}"'
+
+    async def __async_evict(self) -> None:
+        removed = []
+
+        while self.totalBytes > self.maxBytes and len(self.__files) > 1:
+            key = next(iter(self.__files))
+            removed.append(self.__files[key][0])
+            self.__forget(key)
+
+        if len(removed) > 0:
+            await self.hass.async_add_executor_job(self.__remove, removed)
+
+    async def __async_load(self) -> None:
+        if self.__loaded:
+            return
+
+        async with self.__lock:
+            if self.__loaded:
+                return
+
+            files = await self.hass.async_add_executor_job(self.__scan)
+
+            for fileName, fileSize in files:
+                self.__files[fileName.partition(".")[0]] = (fileName, fileSize)
+                self.totalBytes += fileSize
+
+            self.__loaded = True
+
+        LOGGER.debug(f"Cover cache: {len(self.__files)} files, {self.totalBytes} bytes")
+        await self.__async_evict()
+
+    def __forget(self, key: str) -> None:
+        _, fileSize = self.__files.pop(key)
+        self.totalBytes -= fileSize
+
+    @staticmethod
+    def __contentType(fileName: str) -> str:
+        return mimetypes.guess_type(fileName)[0] or "image/jpeg"
+
+    def __scan(self) -> list[tuple[str, int]]:
+        CoverArtCache.__removeLegacyDirectory(self.hass, self.entryId)
+        os.makedirs(self.directory, exist_ok=True)
+        entries = [e for e in os.scandir(self.directory)
+                   if e.is_file() and not e.name.endswith(".tmp")]
+        entries.sort(key=lambda e: e.stat().st_mtime)
+
+        return [(e.name, e.stat().st_size) for e in entries]
+
+    def __read(self, fileName: str) -> bytes | None:
+        path = os.path.join(self.directory, fileName)
+
+        try:
+            with open(path, "rb") as file:
+                content = file.read()
+        except OSError:
+            return None
+
+        os.utime(path)
+        return content
+
+    def __write(self, fileName: str, content: bytes) -> None:
+        path = os.path.join(self.directory, fileName)
+        temp = f"{path}.tmp"
+
+        with open(temp, "wb") as file:
+            file.write(content)
+
+        os.replace(temp, path)
+
+    def __remove(self, fileNames: list[str]) -> None:
+        for fileName in fileNames:
+            try:
+                os.remove(os.path.join(self.directory, fileName))
+            except OSError:
+                pass
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from .coordinator import SubsonicCoordinator
+from .coverCache import CoverArtCache
+from .library import SubsonicLibrary
+from .prefetch import SubsonicPrefetcher
+from .subsonicApi import SubsonicApi
+
+
+@dataclass
+class SubsonicData:
+
+    api: SubsonicApi
+    library: SubsonicLibrary
+    coverCache: CoverArtCache
+    coordinator: SubsonicCoordinator
+    prefetcher: SubsonicPrefetcher
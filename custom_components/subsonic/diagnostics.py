@@ -0,0 +1,56 @@
+from typing import Any
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .data import SubsonicData
+
+TO_REDACT = {"url", "user", "password", "api_key"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    data: SubsonicData = hass.data[DOMAIN][entry.entry_id]
+    api = data.api
+    cache = api.cache
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "api": {
+            "apiVersion": api.apiVersion,
+            "responseFormat": api.responseFormat,
+            "connections": api.connectionStats,
+            "circuitBreaker": {
+                "state": api.circuitBreaker.state,
+                "failures": api.circuitBreaker.failures,
+            },
+            "authTokensGenerated": api.tokenProvider.generated,
+        },
+        "cache": None if cache is None else {
+            "entries": len(cache),
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "coalesced": cache.coalesced,
+            "hitRatio": round(cache.hitRatio(), 3),
+            "endpoints": {
+                endpoint: {**stats, "hitRatio": round(cache.hitRatio(endpoint), 3)}
+                for endpoint, stats in cache.endpointStats.items()
+            },
+        },
+        "metrics": api.metrics.toDict(),
+        "library": {
+            "synced": data.library.synced,
+            "lastModified": data.library.lastModified,
+            "artists": len(data.library.artists),
+            "albums": len(data.library.albums),
+            "playlists": len(data.library.playlists),
+            "genres": len(data.library.genres),
+            "searchIndexEntries": len(data.library.searchIndex),
+            "lastSyncSuccess": data.coordinator.last_update_success,
+        },
+        "prefetch": {
+            "enabled": data.prefetcher.enabled,
+            "prefetched": data.prefetcher.prefetched,
+            "bytesUsed": data.prefetcher.bytesUsed,
+        },
+    }
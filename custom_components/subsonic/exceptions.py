@@ -0,0 +1,14 @@
+class SubsonicApiError(Exception):
+    """Raised when the Subsonic server can't be reached or answers with an error."""
+
+
+class SubsonicServerError(SubsonicApiError):
+    """Raised when the server answers with status="failed"."""
+
+    def __init__(self, code: int | str | None, message: str | None) -> None:
+        super().__init__(f"Subsonic error {code}: {message}")
+        self.code = int(code) if str(code).isdigit() else None
+
+
+class SubsonicCircuitOpenError(SubsonicApiError):
+    """Raised without a request while the circuit breaker is open."""
@@ -0,0 +1,183 @@
+import asyncio
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import ALBUM_PAGE_SIZE, DOMAIN, LIBRARY_STORAGE_VERSION, LOGGER, SEARCH_INDEX_MAX_ENTRIES
+from .exceptions import SubsonicApiError
+from .models import Album, Artist, Playlist, Record, SearchResult
+from .searchIndex import SearchIndex
+from .subsonicApi import SubsonicApi
+
+
+def _pack(items: list[Record]) -> dict:
+    fields = list(dict.fromkeys(key for item in items for key in item))
+
+    return {
+        "fields": fields,
+        "rows": [[item.get(f) for f in fields] for item in items]
+    }
+
+def _unpack(packed: dict | None, recordType: type[Record]) -> list[Record]:
+    if not packed:
+        return []
+
+    fields = packed["fields"]
+    return [
+        recordType.fromDict({f: v for f, v in zip(fields, row) if v is not None})
+        for row in packed["rows"]
+    ]
+
+
+class SubsonicLibrary:
+    """Synced library index, persisted to .storage between restarts."""
+
+    def __init__(self, hass: HomeAssistant, api: SubsonicApi, entryId: str) -> None:
+        self.hass = hass
+        self.api = api
+        self.lastModified = 0
+        self.artists: list[Artist] = []
+        self.albums: list[Album] = []
+        self.playlists: list[Playlist] = []
+        self.genres: list[str] = []
+        self.searchIndex = SearchIndex(SEARCH_INDEX_MAX_ENTRIES)
+        self.__store = Store(hass, LIBRARY_STORAGE_VERSION, f"{DOMAIN}.{entryId}.library")
+        self.__lock = asyncio.Lock()
+        self.__loaded = False
+        self.__synced = False
+        self.__searchIndexBuilt = False
+
+        api.songListeners.append(lambda songs: self.searchIndex.add("song", songs))
+
+    @property
+    def loaded(self) -> bool:
+        return self.__loaded
+
+    @property
+    def synced(self) -> bool:
+        return self.__synced
+
+    async def async_ensure_loaded(self) -> None:
+        if self.__loaded:
+            return
+
+        async with self.__lock:
+            if self.__loaded:
+                return
+
+            stored = await self.__store.async_load()
+
+            if stored is not None:
+                self.__restore(stored)
+                self.__primeCache()
+                await self.__async_update_search_index()
+                self.__synced = True
+
+            self.__loaded = True
+
+    async def async_revalidate(self) -> bool:
+        lastModified = await self.api.getIndexesLastModified(self.lastModified)
+
+        if self.lastModified != 0 and lastModified <= self.lastModified:
+            LOGGER.debug("Library not modified since last snapshot")
+            return False
+
+        await self.async_refresh(lastModified)
+        return True
+
+    async def async_refresh(self, lastModified: int = 0) -> None:
+        for endpoint in ("getArtists", "getAlbumList2", "getPlaylists", "getGenres"):
+            self.api.invalidateCache(endpoint)
+
+        self.artists, self.albums, self.playlists, self.genres = await asyncio.gather(
+            self.api.getArtists(),
+            self.api.getAlbums(),
+            self.api.getPlaylists(),
+            self.api.getGenres(),
+        )
+        self.lastModified = lastModified
+        self.__synced = True
+        await self.__async_update_search_index()
+
+        await self.__store.async_save(self.__serialize())
+        LOGGER.debug(f"Library snapshot saved: {len(self.artists)} artists, {len(self.albums)} albums")
+
+    async def async_get_artists(self) -> list[Artist]:
+        await self.async_ensure_loaded()
+        return self.artists if self.__synced else await self.api.getArtists()
+
+    async def async_get_playlists(self) -> list[Playlist]:
+        # Playlist edits don't move getIndexes.lastModified, so the snapshot
+        # is only a fallback; the API keeps them fresh through its short TTL.
+        await self.async_ensure_loaded()
+
+        try:
+            self.playlists = await self.api.getPlaylists()
+        except SubsonicApiError:
+            if not self.__synced:
+                raise
+
+            LOGGER.debug("Could not refresh playlists, using library snapshot")
+
+        return self.playlists
+
+    async def async_get_genres(self) -> list[str]:
+        await self.async_ensure_loaded()
+        return self.genres if self.__synced else await self.api.getGenres()
+
+    async def async_get_albums_page(self, offset: int, count: int) -> list[Album]:
+        await self.async_ensure_loaded()
+
+        if self.__synced:
+            return self.albums[offset:offset + count]
+
+        return await self.api.getAlbumsPage(offset, count)
+
+    def search(self, query: str, limit: int) -> SearchResult:
+        return self.searchIndex.search(query, limit)
+
+    async def __async_update_search_index(self) -> None:
+        if self.__searchIndexBuilt:
+            # Unchanged records are skipped before tokenising, so a sync only
+            # pays for what changed.
+            changes = self.__updateSearchIndex(self.searchIndex, self.artists, self.albums)
+        else:
+            # The first build tokenises the whole library; do it off the loop
+            # on a fresh index, then swap it in. Songs indexed meanwhile are
+            # only a browse cache and come back on the next browse.
+            index = SearchIndex(SEARCH_INDEX_MAX_ENTRIES)
+            changes = await self.hass.async_add_executor_job(self.__updateSearchIndex,
+                                                             index,
+                                                             self.artists,
+                                                             self.albums)
+            self.searchIndex = index
+            self.__searchIndexBuilt = True
+
+        LOGGER.debug(f"Search index updated: {changes} changes, {len(self.searchIndex)} entries")
+
+    @staticmethod
+    def __updateSearchIndex(index: SearchIndex, artists: list[Artist], albums: list[Album]) -> int:
+        return index.update("artist", artists) + index.update("album", albums)
+
+    def __serialize(self) -> dict:
+        return {
+            "lastModified": self.lastModified,
+            "artists": _pack(self.artists),
+            "albums": _pack(self.albums),
+            "playlists": _pack(self.playlists),
+            "genres": self.genres,
+        }
+
+    def __restore(self, stored: dict) -> None:
+        self.lastModified = stored.get("lastModified", 0)
+        self.artists = _unpack(stored.get("artists"), Artist)
+        self.albums = _unpack(stored.get("albums"), Album)
+        self.playlists = _unpack(stored.get("playlists"), Playlist)
+        self.genres = stored.get("genres", [])
+
+    def __primeCache(self) -> None:
+        self.api.primeCache("getArtists", (), self.artists)
+        self.api.primeCache("getGenres", (), self.genres)
+
+        for offset in range(0, len(self.albums) + 1, ALBUM_PAGE_SIZE):
+            page = self.albums[offset:offset + ALBUM_PAGE_SIZE]
+            self.api.primeCache("getAlbumList2", (offset, ALBUM_PAGE_SIZE), page)
@@ -1,4 +1,14 @@
-from homeassistant.components.media_player import BrowseError, MediaClass, MediaType
+import asyncio
+from contextvars import ContextVar
+from urllib.parse import quote, unquote
+
+from homeassistant.components.media_player import (
+    BrowseError,
+    MediaClass,
+    MediaType,
+    SearchMedia,
+    SearchMediaQuery,
+)
 from homeassistant.components.media_source.error import Unresolvable
 from homeassistant.components.media_source.models import (
     BrowseMediaSource,
@@ -9,17 +19,40 @@ from homeassistant.components.media_source.models import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 
-from .const import DOMAIN, LOGGER
+from .const import ARTIST_BUCKET_OTHER, \
+    ARTIST_BUCKET_OTHER_TITLE, \
+    BROWSE_PAGE_SIZE, \
+    COVER_THUMBNAIL_SIZE, \
+    DOMAIN, \
+    GENRE_PAGE_SIZE, \
+    LOGGER, \
+    SEARCH_DEBOUNCE, \
+    SEARCH_PAGE_SIZE, \
+    SERVER_BROWSE_TIMEOUT, \
+    STREAM_PROFILE_DEFAULT
+from .coverCache import CoverArtCache
+from .data import SubsonicData
+from .exceptions import SubsonicApiError
+from .library import SubsonicLibrary
+from .models import SearchResult
+from .prefetch import SubsonicPrefetcher
+from .searchIndex import fold
 from .subsonicApi import SubsonicApi
 from .translation import getTranslation
 
+# Thumbnail URLs already built during the current browse, keyed by cover id.
+_thumbnails: ContextVar[dict[str, str] | None] = ContextVar(f"{DOMAIN}_thumbnails", default=None)
+
+
+class SubsonicServerSource:
+    """Browses and resolves the media of a single config entry."""
 
-class SubsonicSource(MediaSource):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        super().__init__(DOMAIN)
         self.hass = hass
         self.entry = entry
-        self.__api = None
+        self.entryId = entry.entry_id
+        self.__searchGeneration = 0
+        self.__pendingSearch: asyncio.Future[SearchMedia] | None = None
         self.name = self.title
 
     @property
@@ -50,12 +83,29 @@ class SubsonicSource(MediaSource):
     def radio(self) -> bool:
         return self.__getOption("radio", False)
 
+    @property
+    def streamProfile(self) -> str:
+        return self.__getOption("stream_profile", STREAM_PROFILE_DEFAULT)
+
+    @property
+    def data(self) -> SubsonicData:
+        return self.hass.data[DOMAIN][self.entryId]
+
     @property
     def api(self) -> SubsonicApi:
-        if self.__api is None:
-            self.__api = self.hass.data[DOMAIN]
+        return self.data.api
 
-        return self.__api
+    @property
+    def library(self) -> SubsonicLibrary:
+        return self.data.library
+
+    @property
+    def coverCache(self) -> CoverArtCache:
+        return self.data.coverCache
+
+    @property
+    def prefetcher(self) -> SubsonicPrefetcher:
+        return self.data.prefetcher
 
     def __getProperty(self, property, dafultValue=None):
         if (self.entry is not None
@@ -83,21 +133,130 @@ class SubsonicSource(MediaSource):
         lang = self.hass.config.language
         return getTranslation(lang, key)
 
+    def __getThumbnail(self, coverArtId: str) -> str:
+        return self.__getThumbnails([{"coverArt": coverArtId}])[0]
 
+    def __getThumbnails(self, items: list, default: str | None = None) -> list[str | None]:
+        # Songs of one album share a cover id; sign each id once per browse.
+        thumbnails = _thumbnails.get()
 
-    async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
-        if item.identifier.startswith("radio/"):
-            return await self.async_resolve_radio(item.identifier)
+        if thumbnails is None:
+            thumbnails = {}
+
+        coverIds = [item.get("coverArt") or None for item in items]
+        missing = list(dict.fromkeys(c for c in coverIds if c is not None and c not in thumbnails))
+
+        if len(missing) > 0:
+            thumbnails.update(zip(missing, self.coverCache.getUrls(missing, COVER_THUMBNAIL_SIZE)))
+
+        return [default if c is None else thumbnails[c] for c in coverIds]
+
+    @staticmethod
+    def __getPage(window: str) -> int:
+        pageText = window.rpartition("page/")[2]
+        return int(pageText) if pageText.isdigit() else 0
+
+    def __getNextPage(self, identifier: str) -> BrowseMediaSource:
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=f"{self.entryId}/{identifier}",
+            media_class=MediaClass.DIRECTORY,
+            media_content_type=MediaType.MUSIC,
+            title=self.__getTranslation("next_page"),
+            can_play=False,
+            can_expand=True,
+        )
+
+    def __getArtistBuckets(self, artists: list) -> list[BrowseMediaSource]:
+        buckets = sorted({self.__getArtistBucket(artist) for artist in artists},
+                         key=lambda bucket: (bucket == ARTIST_BUCKET_OTHER, bucket))
+
+        return [
+            BrowseMediaSource(
+                domain=DOMAIN,
+                identifier=f"{self.entryId}/browser/artists/{bucket}",
+                media_class=MediaClass.DIRECTORY,
+                media_content_type=MediaType.MUSIC,
+                title=self.__getBucketTitle(bucket),
+                can_play=False,
+                can_expand=True,
+            )
+            for bucket in buckets
+        ]
+
+    @staticmethod
+    def __getBucketTitle(bucket: str) -> str:
+        return ARTIST_BUCKET_OTHER_TITLE if bucket == ARTIST_BUCKET_OTHER else bucket
+
+    @staticmethod
+    def __getArtistBucket(artist) -> str:
+        # Prefer the server's index group, which already skips ignored
+        # articles; snapshots saved before it was recorded fall back to the name.
+        letter = fold(artist.get("index") or artist.get("name") or "")[:1].upper()
+
+        return letter if "A" <= letter <= "Z" else ARTIST_BUCKET_OTHER
+
+    def __getSearchItems(self, result: SearchResult) -> list[BrowseMediaSource]:
+        items: list[BrowseMediaSource] = []
+
+        for artist, coveart in zip(result.artists, self.__getThumbnails(result.artists)):
+            items.append(
+                BrowseMediaSource(
+                    domain=DOMAIN,
+                    identifier=f"{self.entryId}/artist/{artist['id']}",
+                    media_class=MediaClass.ARTIST,
+                    media_content_type=MediaType.MUSIC,
+                    title=artist["name"],
+                    can_play=False,
+                    can_expand=True,
+                    thumbnail=coveart
+                )
+            )
+
+        for album, coveart in zip(result.albums, self.__getThumbnails(result.albums)):
+            items.append(
+                BrowseMediaSource(
+                    domain=DOMAIN,
+                    identifier=f"{self.entryId}/album/{album['id']}",
+                    media_class=MediaClass.ALBUM,
+                    media_content_type=MediaType.ALBUM,
+                    title=album["name"],
+                    can_play=False,
+                    can_expand=True,
+                    thumbnail=coveart
+                )
+            )
+
+        for song, coveart in zip(result.songs, self.__getThumbnails(result.songs)):
+            items.append(
+                BrowseMediaSource(
+                    domain=DOMAIN,
+                    identifier=f"{self.entryId}/song/{song['id']}",
+                    media_class=MediaClass.MUSIC,
+                    media_content_type=MediaType.MUSIC,
+                    title=song["title"],
+                    can_play=True,
+                    can_expand=False,
+                    thumbnail=coveart
+                )
+            )
+
+        return items
+
+
+
+    async def async_resolve_media(self, identifier: str) -> PlayMedia:
+        if identifier.startswith("radio/"):
+            return await self.async_resolve_radio(identifier)
         
-        if item.identifier.startswith("song/"):
-            return await self.async_resolve_song(item.identifier)
+        if identifier.startswith("song/"):
+            return await self.async_resolve_song(identifier)
         
         raise Unresolvable("Can't resolve media item")
     
     async def async_resolve_radio(self, identifier: str) -> PlayMedia:
         radioId = identifier.replace("radio/", "")
-        radios = await self.api.getRadioStations()
-        radio = next((r for r in radios if r["id"] == radioId), None)
+        radio = await self.api.getRadioStation(radioId)
 
         if radio is None:
             raise Unresolvable(f"Radio {radioId} not found")
@@ -106,21 +265,38 @@ class SubsonicSource(MediaSource):
 
     async def async_resolve_song(self, identifier: str) -> PlayMedia:
         songId = identifier.replace("song/", "")
-        song = await self.api.getSong(songId)
-        contentType = song["contentType"] if "contentType" in song else "audio/mpeg"
+        song = await self.api.getSongInfo(songId)
+        contentType = self.api.getStreamContentType(self.streamProfile, song)
 
-        streamUrl = self.api.getSongStreamUrl(songId)
+        streamUrl = self.api.getSongStreamUrl(songId, self.streamProfile)
 
         return PlayMedia(streamUrl, contentType)
 
 
 
-    async def async_browse_media(self, item: MediaSourceItem) -> BrowseMediaSource:
+    async def async_browse_media(self, identifier: str) -> BrowseMediaSource:
+        tokens = self.api.tokenProvider.generated
+        thumbnails = _thumbnails.set({})
+        section = identifier.split("/")[0] or "root"
+
+        if section == "browser":
+            section = "/".join(identifier.split("/")[:2])
 
-        identifier = item.identifier or ""
+        try:
+            with self.api.metrics.timer(f"browse:{section}", "browseTime"):
+                result = await self.async_browse_identifier(identifier)
+
+            self.api.metrics.record(f"browse:{section}", "items", len(result.children or []))
+            return result
+        finally:
+            _thumbnails.reset(thumbnails)
+            generated = self.api.tokenProvider.generated - tokens
+            LOGGER.debug(f"Browse {self.entryId}/{identifier}: {generated} auth tokens generated")
+
+    async def async_browse_identifier(self, identifier: str) -> BrowseMediaSource:
 
         if identifier.startswith("browser/"):
-            return await self.async_browser_item(item.identifier.replace("browser/", ""))
+            return await self.async_browser_item(identifier.replace("browser/", ""))
         elif identifier.startswith("album/"):
             return await self.async_list_songs_album(identifier.replace("album/", ""))
         elif identifier.startswith("playlist/"):
@@ -129,6 +305,8 @@ class SubsonicSource(MediaSource):
             return await self.async_list_songs_genre(identifier.replace("genre/", ""))
         elif identifier.startswith("artist/"):
             return await self.async_list_albums_artist(identifier.replace("artist/", ""))
+        elif identifier.startswith("search/"):
+            return await self.async_list_search(identifier.replace("search/", "", 1))
 
 
         return await self.async_browse_root()
@@ -142,7 +320,7 @@ class SubsonicSource(MediaSource):
             childrens.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier="browser/artists",
+                    identifier=f"{self.entryId}/browser/artists",
                     media_class=MediaClass.DIRECTORY,
                     media_content_type=MediaType.MUSIC,
                     title=self.__getTranslation("artists"),
@@ -156,7 +334,7 @@ class SubsonicSource(MediaSource):
             childrens.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier="browser/albums",
+                    identifier=f"{self.entryId}/browser/albums",
                     media_class=MediaClass.DIRECTORY,
                     media_content_type=MediaType.MUSIC,
                     title=self.__getTranslation("albums"),
@@ -169,7 +347,7 @@ class SubsonicSource(MediaSource):
             childrens.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier="browser/playlist",
+                    identifier=f"{self.entryId}/browser/playlist",
                     media_class=MediaClass.DIRECTORY,
                     media_content_type=MediaType.MUSIC,
                     title=self.__getTranslation("playlists"),
@@ -182,7 +360,7 @@ class SubsonicSource(MediaSource):
             childrens.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier="browser/radio",
+                    identifier=f"{self.entryId}/browser/radio",
                     media_class=MediaClass.DIRECTORY,
                     media_content_type=MediaType.MUSIC,
                     title=self.__getTranslation("radios"),
@@ -196,7 +374,7 @@ class SubsonicSource(MediaSource):
             childrens.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier="browser/favorites",
+                    identifier=f"{self.entryId}/browser/favorites",
                     media_class=MediaClass.DIRECTORY,
                     media_content_type=MediaType.MUSIC,
                     title=self.__getTranslation("favorites"),
@@ -210,7 +388,7 @@ class SubsonicSource(MediaSource):
             childrens.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier="browser/genres",
+                    identifier=f"{self.entryId}/browser/genres",
                     media_class=MediaClass.DIRECTORY,
                     media_content_type=MediaType.MUSIC,
                     title=self.__getTranslation("genres"),
@@ -221,7 +399,7 @@ class SubsonicSource(MediaSource):
 
         return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=None,
+            identifier=self.entryId,
             media_class=MediaClass.CHANNEL,
             media_content_type=MediaType.MUSIC,
             title=self.title,
@@ -237,14 +415,15 @@ class SubsonicSource(MediaSource):
         childrens = []
         content_type = MediaType.MUSIC
         children_type = MediaClass.DIRECTORY
+        section, _, window = identifier.partition("/")
 
         if identifier == "radio":
             title = self.__getTranslation("radios")
             childrens = await self.async_list_radios()
             children_type = MediaClass.MUSIC
-        elif identifier == "albums":
+        elif section == "albums":
             title = self.__getTranslation("albums")
-            childrens = await self.async_list_albums()
+            childrens = await self.async_list_albums(window)
             children_type = MediaClass.ALBUM
         elif identifier == "playlist":
             title = self.__getTranslation("playlists")
@@ -254,14 +433,16 @@ class SubsonicSource(MediaSource):
             title = self.__getTranslation("genres")
             childrens = await self.async_list_genres()
             children_type = MediaClass.GENRE
-        elif identifier == "artists":
+        elif section == "artists":
+            bucket = window.partition("/")[0]
             title = self.__getTranslation("artists")
-            childrens = await self.async_list_artists()
-            children_type = MediaClass.ARTIST
+            title = title if bucket == "" else f"{title}: {self.__getBucketTitle(bucket)}"
+            childrens = await self.async_list_artists(window)
+            children_type = childrens[0].media_class if len(childrens) > 0 else MediaClass.ARTIST
 
         return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=identifier,
+            identifier=f"{self.entryId}/browser/{identifier}",
             media_class=MediaClass.DIRECTORY,
             media_content_type=content_type,
             title=title,
@@ -279,7 +460,7 @@ class SubsonicSource(MediaSource):
             items.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier=f"radio/{radio['id']}",
+                    identifier=f"{self.entryId}/radio/{radio['id']}",
                     media_class=MediaClass.MUSIC,
                     media_content_type=MediaType.MUSIC,
                     title=radio["name"],
@@ -290,22 +471,16 @@ class SubsonicSource(MediaSource):
 
         return items
     
-    async def async_list_albums(self) -> list[BrowseMediaSource]:
+    async def async_list_albums(self, window: str = "") -> list[BrowseMediaSource]:
         items: list[BrowseMediaSource] = []
-        albums = await self.api.getAlbums()
-
-        for album in albums:
-            coveart = None
-
-            if ("coverArt" in album
-                and album["coverArt"] is not None
-                and album["coverArt"] != ""):
-                coveart = self.api.getCoverArtUrl(album["coverArt"])
+        page = self.__getPage(window)
+        albums = await self.library.async_get_albums_page(page * BROWSE_PAGE_SIZE, BROWSE_PAGE_SIZE)
 
+        for album, coveart in zip(albums, self.__getThumbnails(albums)):
             items.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier=f"album/{album['id']}",
+                    identifier=f"{self.entryId}/album/{album['id']}",
                     media_class=MediaClass.ALBUM,
                     media_content_type=MediaType.ALBUM,
                     title=album["name"],
@@ -315,11 +490,16 @@ class SubsonicSource(MediaSource):
                 )
             )
 
+        if len(albums) == BROWSE_PAGE_SIZE:
+            items.append(self.__getNextPage(f"browser/albums/page/{page + 1}"))
+
+        self.prefetcher.schedule("album", [album["id"] for album in albums])
+
         return items
     
     async def async_list_playlists(self) -> list[BrowseMediaSource]:
         items: list[BrowseMediaSource] = []
-        playlists = await self.api.getPlaylists()
+        playlists = await self.library.async_get_playlists()
 
         for playlist in playlists:
             coveart = None
@@ -327,12 +507,12 @@ class SubsonicSource(MediaSource):
             if ("coverArt" in playlist
                 and playlist["coverArt"] is not None
                 and playlist["coverArt"] != ""):
-                coveart = self.api.getCoverArtUrl(playlist["coverArt"])
+                coveart = self.__getThumbnail(playlist["coverArt"])
 
             items.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier=f"playlist/{playlist['id']}",
+                    identifier=f"{self.entryId}/playlist/{playlist['id']}",
                     media_class=MediaClass.PLAYLIST,
                     media_content_type=MediaType.PLAYLIST,
                     title=playlist["name"],
@@ -346,13 +526,13 @@ class SubsonicSource(MediaSource):
     
     async def async_list_genres(self) -> list[BrowseMediaSource]:
         items: list[BrowseMediaSource] = []
-        genres = await self.api.getGenres()
+        genres = await self.library.async_get_genres()
 
         for genre in genres:
             items.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier=f"genre/{genre}",
+                    identifier=f"{self.entryId}/genre/{genre}",
                     media_class=MediaClass.GENRE,
                     media_content_type=MediaType.MUSIC,
                     title=genre,
@@ -363,23 +543,25 @@ class SubsonicSource(MediaSource):
 
         return items
 
-    async def async_list_artists(self) -> list[BrowseMediaSource]:
+    async def async_list_artists(self, window: str = "") -> list[BrowseMediaSource]:
         items: list[BrowseMediaSource] = []
+        bucket, _, pageText = window.partition("/")
+        artists = await self.library.async_get_artists()
 
-        artists = await self.api.getArtists()
+        if bucket == "" and len(artists) > BROWSE_PAGE_SIZE:
+            return self.__getArtistBuckets(artists)
 
-        for artist in artists:
-            coverArt = None
+        if bucket != "":
+            artists = [artist for artist in artists if self.__getArtistBucket(artist) == bucket]
 
-            if ("coverArt" in artist
-                and artist["coverArt"] is not None
-                and artist["coverArt"] != ""):
-                coverArt = self.api.getCoverArtUrl(artist["coverArt"])
+        page = self.__getPage(pageText)
+        visible = artists[page * BROWSE_PAGE_SIZE:(page + 1) * BROWSE_PAGE_SIZE]
 
+        for artist, coverArt in zip(visible, self.__getThumbnails(visible)):
             items.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier=f"artist/{artist['id']}",
+                    identifier=f"{self.entryId}/artist/{artist['id']}",
                     media_class=MediaClass.ARTIST,
                     media_content_type=MediaType.MUSIC,
                     title=artist["name"],
@@ -389,38 +571,43 @@ class SubsonicSource(MediaSource):
                 )
             )
 
-        return items
+        if bucket != "" and len(artists) > (page + 1) * BROWSE_PAGE_SIZE:
+            items.append(self.__getNextPage(f"browser/artists/{bucket}/page/{page + 1}"))
 
-        
+        self.prefetcher.schedule("artist", [artist["id"] for artist in visible])
+
+        return items
 
     async def async_list_songs_album(self, albumId: str) -> list[BrowseMediaSource]:
         items: list[BrowseMediaSource] = []
+        self.prefetcher.recordOpen("album", albumId)
         album = await self.api.getAlbum(albumId)
+        coveart = None
 
-        for song in album["songs"]:
-            coveart = None
+        if ("coverArt" in album
+            and album["coverArt"] is not None
+            and album["coverArt"] != ""):
+            coveart = self.__getThumbnail(album["coverArt"])
 
-            if ("coverArt" in album
-                and album["coverArt"] is not None
-                and album["coverArt"] != ""):
-                coveart = self.api.getCoverArtUrl(album["coverArt"])
+        thumbnails = self.__getThumbnails(album["songs"], coveart)
 
+        for song, songCoveart in zip(album["songs"], thumbnails):
             items.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier=f"song/{song['id']}",
+                    identifier=f"{self.entryId}/song/{song['id']}",
                     media_class=MediaClass.MUSIC,
                     media_content_type=MediaType.MUSIC,
                     title=song["title"],
                     can_play=True,
                     can_expand=False,
-                    thumbnail=coveart
+                    thumbnail=songCoveart
                 )
             )
 
         return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=f"album/{albumId}",
+            identifier=f"{self.entryId}/album/{albumId}",
             media_class=MediaClass.ALBUM,
             media_content_type=MediaType.ALBUM,
             title=album["name"],
@@ -440,13 +627,13 @@ class SubsonicSource(MediaSource):
         if ("coverArt" in playlist
             and playlist["coverArt"] is not None
             and playlist["coverArt"] != ""):
-            coveart = self.api.getCoverArtUrl(playlist["coverArt"])
+            coveart = self.__getThumbnail(playlist["coverArt"])
 
         for song in playlist["songs"]:
             items.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier=f"song/{song['id']}",
+                    identifier=f"{self.entryId}/song/{song['id']}",
                     media_class=MediaClass.MUSIC,
                     media_content_type=MediaType.MUSIC,
                     title=song["title"],
@@ -458,7 +645,7 @@ class SubsonicSource(MediaSource):
 
         return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=f"playlist/{playlistId}",
+            identifier=f"{self.entryId}/playlist/{playlistId}",
             media_class=MediaClass.PLAYLIST,
             media_content_type=MediaType.PLAYLIST,
             title=playlist["name"],
@@ -469,23 +656,25 @@ class SubsonicSource(MediaSource):
             children=items,
         )
     
-    async def async_list_songs_genre(self, genreId: str) -> list[BrowseMediaSource]:
+    async def async_list_songs_genre(self, identifier: str) -> list[BrowseMediaSource]:
         items: list[BrowseMediaSource] = []
+        genreId, page = identifier, 0
 
-        songs = await self.api.getSongsByGenre(genreId)
+        if "/page/" in identifier:
+            genreId, _, pageText = identifier.rpartition("/page/")
+            page = int(pageText) if pageText.isdigit() else 0
 
-        for song in songs:
-            coveart = None
+        songs = await self.api.getSongsByGenre(genreId,
+                                               count=GENRE_PAGE_SIZE,
+                                               offset=page * GENRE_PAGE_SIZE)
 
-            if ("coverArt" in song
-                and song["coverArt"] is not None
-                and song["coverArt"] != ""):
-                coveart = self.api.getCoverArtUrl(song["coverArt"])
+        thumbnails = self.__getThumbnails(songs)
 
+        for song, coveart in zip(songs, thumbnails):
             items.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier=f"song/{song['id']}",
+                    identifier=f"{self.entryId}/song/{song['id']}",
                     media_class=MediaClass.MUSIC,
                     media_content_type=MediaType.MUSIC,
                     title=song["title"],
@@ -495,9 +684,12 @@ class SubsonicSource(MediaSource):
                 )
             )
 
+        if len(songs) == GENRE_PAGE_SIZE:
+            items.append(self.__getNextPage(f"genre/{genreId}/page/{page + 1}"))
+
         return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=f"genre/{genreId}",
+            identifier=f"{self.entryId}/genre/{identifier}",
             media_class=MediaClass.GENRE,
             media_content_type=MediaType.MUSIC,
             title=genreId,
@@ -509,6 +701,7 @@ class SubsonicSource(MediaSource):
         
     async def async_list_albums_artist(self, artistId: str) -> list[BrowseMediaSource]:
         items: list[BrowseMediaSource] = []
+        self.prefetcher.recordOpen("artist", artistId)
 
         artist = await self.api.getArtist(artistId)
         coveart = None
@@ -516,7 +709,7 @@ class SubsonicSource(MediaSource):
         if ("coverArt" in artist
             and artist["coverArt"] is not None
             and artist["coverArt"] != ""):
-            coveart = self.api.getCoverArtUrl(artist["coverArt"])
+            coveart = self.__getThumbnail(artist["coverArt"])
 
         for album in artist["albums"]:
             albumCoveart = None
@@ -524,12 +717,12 @@ class SubsonicSource(MediaSource):
             if ("coverArt" in album
                 and album["coverArt"] is not None
                 and album["coverArt"] != ""):
-                albumCoveart = self.api.getCoverArtUrl(album["coverArt"])
+                albumCoveart = self.__getThumbnail(album["coverArt"])
 
             items.append(
                 BrowseMediaSource(
                     domain=DOMAIN,
-                    identifier=f"album/{album['id']}",
+                    identifier=f"{self.entryId}/album/{album['id']}",
                     media_class=MediaClass.ALBUM,
                     media_content_type=MediaType.ALBUM,
                     title=album["name"],
@@ -539,9 +732,11 @@ class SubsonicSource(MediaSource):
                 )
             )
 
+        self.prefetcher.schedule("album", [album["id"] for album in artist["albums"]])
+
         return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=f"artist/{artistId}",
+            identifier=f"{self.entryId}/artist/{artistId}",
             media_class=MediaClass.ARTIST,
             media_content_type=MediaType.MUSIC,
             title=artist["name"],
@@ -552,7 +747,217 @@ class SubsonicSource(MediaSource):
             children=items,
         )
 
+    async def async_search_media(self, query: SearchMediaQuery) -> SearchMedia:
+        # Typeahead sends a query per keystroke; only the last one within the
+        # debounce window reaches the server, and the earlier calls get its
+        # result instead of an empty one.
+        self.__searchGeneration += 1
+        generation = self.__searchGeneration
+
+        if self.__pendingSearch is None:
+            self.__pendingSearch = asyncio.get_running_loop().create_future()
+            # Nobody may wait for the result, so don't log an unretrieved error.
+            self.__pendingSearch.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        pending = self.__pendingSearch
+
+        await asyncio.sleep(SEARCH_DEBOUNCE)
+
+        if generation != self.__searchGeneration:
+            return await asyncio.shield(pending)
+
+        # Keystrokes from now on start a new window.
+        self.__pendingSearch = None
+
+        try:
+            result = SearchMedia(result=await self.async_search(query.search_query))
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as exception:
+            pending.set_exception(exception)
+            raise
+
+        pending.set_result(result)
+        return result
+
+    async def async_search(self, query: str) -> list[BrowseMediaSource]:
+        if query.strip() == "":
+            return []
+
+        result = await self.async_list_search(quote(query.strip(), safe=""))
+
+        return result.children
+
+    async def async_list_search(self, identifier: str) -> BrowseMediaSource:
+        encodedQuery, page = identifier, 0
+
+        if "/page/" in identifier:
+            encodedQuery, _, pageText = identifier.rpartition("/page/")
+            page = int(pageText) if pageText.isdigit() else 0
+
+        query = unquote(encodedQuery)
+        local = SearchResult()
+
+        # The local index has every synced artist and album, but only the
+        # songs of browsed albums, so it adds to search3 instead of
+        # replacing it; it also answers when the server can't.
+        if page == 0:
+            local = self.library.search(query, SEARCH_PAGE_SIZE)
+
+        try:
+            result = await self.api.search(query,
+                                           count=SEARCH_PAGE_SIZE,
+                                           offset=page * SEARCH_PAGE_SIZE)
+        except SubsonicApiError as exception:
+            if len(local) == 0:
+                raise
+
+            LOGGER.debug(f"Search on {self.title} failed, using the local index: {exception}")
+            result = SearchResult()
+
+        full = max(len(result.artists), len(result.albums), len(result.songs)) == SEARCH_PAGE_SIZE
+        result = local.merge(result, SEARCH_PAGE_SIZE)
+        items = self.__getSearchItems(result)
+
+        if full:
+            items.append(self.__getNextPage(f"search/{encodedQuery}/page/{page + 1}"))
+
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=f"{self.entryId}/search/{identifier}",
+            media_class=MediaClass.DIRECTORY,
+            media_content_type=MediaType.MUSIC,
+            title=f"{self.__getTranslation('search')}: {query}",
+            can_play=False,
+            can_expand=True,
+            children_media_class=MediaClass.MUSIC,
+            children=items,
+        )
+
+
+
+class SubsonicSource(MediaSource):
+    """Media source spanning every configured Subsonic server.
+
+    Identifiers are prefixed with the config entry id. Identifiers without
+    a known prefix predate multi-server support and go to the first server.
+    """
+
+    name = "Subsonic"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(DOMAIN)
+        self.hass = hass
+        self.__servers: dict[str, SubsonicServerSource] = {}
+
+    @property
+    def servers(self) -> list[SubsonicServerSource]:
+        entryIds = list(self.hass.data.get(DOMAIN, {}))
+
+        for entryId in [e for e in self.__servers if e not in entryIds]:
+            del self.__servers[entryId]
+
+        for entryId in entryIds:
+            if entryId not in self.__servers:
+                entry = self.hass.config_entries.async_get_entry(entryId)
+                self.__servers[entryId] = SubsonicServerSource(self.hass, entry)
+
+        return list(self.__servers.values())
+
+    def __getServer(self, identifier: str) -> tuple[SubsonicServerSource, str]:
+        servers = self.servers
+
+        if len(servers) == 0:
+            raise BrowseError("No Subsonic server configured")
+
+        entryId, _, rest = identifier.partition("/")
+
+        for server in servers:
+            if server.entryId == entryId:
+                return server, rest
+
+        return servers[0], identifier
+
+    async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
+        try:
+            server, identifier = self.__getServer(item.identifier or "")
+        except BrowseError as e:
+            raise Unresolvable(str(e)) from e
+
+        return await server.async_resolve_media(identifier)
+
+    async def async_browse_media(self, item: MediaSourceItem) -> BrowseMediaSource:
+        if not item.identifier and len(self.servers) != 1:
+            return await self.async_browse_servers()
+
+        server, identifier = self.__getServer(item.identifier or "")
+        return await server.async_browse_media(identifier)
+
+    async def async_browse_servers(self) -> BrowseMediaSource:
+        servers = self.servers
+        results = await asyncio.gather(
+            *(self.__async_browse_server(server) for server in servers),
+            return_exceptions=True
+        )
+        childrens = []
+
+        for server, result in zip(servers, results):
+            if isinstance(result, BaseException):
+                LOGGER.warning(f"Subsonic server {server.title} unavailable: {result!r}")
+                continue
+
+            childrens.append(result)
+
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=None,
+            media_class=MediaClass.DIRECTORY,
+            media_content_type=MediaType.MUSIC,
+            title=self.name,
+            can_play=False,
+            can_expand=True,
+            children_media_class=MediaClass.CHANNEL,
+            children=childrens,
+        )
+
+    async def async_search_media(self, query: SearchMediaQuery) -> SearchMedia:
+        async def search(server: SubsonicServerSource) -> list[BrowseMediaSource]:
+            return (await server.async_search_media(query)).result
+
+        return SearchMedia(result=await self.__async_search(search))
+
+    async def async_search(self, query: str, entryId: str | None = None) -> list[BrowseMediaSource]:
+        """Search without the typeahead debounce, e.g. for the search service."""
+        if entryId is not None and entryId not in self.hass.data.get(DOMAIN, {}):
+            raise BrowseError(f"Unknown Subsonic server {entryId}")
+
+        return await self.__async_search(lambda server: server.async_search(query),
+                                         lambda server: entryId in (None, server.entryId))
+
+    async def __async_search(self, search, include=lambda server: True) -> list[BrowseMediaSource]:
+        servers = [server for server in self.servers if include(server)]
+        results = await asyncio.gather(
+            *(asyncio.wait_for(search(server), SERVER_BROWSE_TIMEOUT) for server in servers),
+            return_exceptions=True
+        )
+        items = []
+
+        for server, result in zip(servers, results):
+            if isinstance(result, BaseException):
+                LOGGER.warning(f"Search on {server.title} failed: {result!r}")
+                continue
+
+            items.extend(result)
+
+        return items
+
+    @staticmethod
+    async def __async_browse_server(server: SubsonicServerSource) -> BrowseMediaSource:
+        async with asyncio.timeout(SERVER_BROWSE_TIMEOUT):
+            await server.api.ping()
+            return await server.async_browse_root()
+
+
 async def async_get_media_source(hass: HomeAssistant) -> SubsonicSource:
-    LOGGER.warning("async_get_media_source")
-    entry = hass.config_entries.async_entries(DOMAIN)[0]
-    return SubsonicSource(hass, entry)
\ No newline at end of file
+    return SubsonicSource(hass)
\ No newline at end of file
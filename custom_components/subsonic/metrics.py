@@ -0,0 +1,109 @@
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Iterator
+
+# Upper bounds shared by every histogram; values are milliseconds, bytes or
+# item counts depending on the metric, so the buckets grow geometrically.
+BUCKETS: tuple[float, ...] = tuple(2 ** i for i in range(0, 28))
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum, min and max."""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def record(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.buckets[bisect_left(BUCKETS, value)] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+
+        for i, n in enumerate(self.buckets):
+            seen += n
+
+            if seen >= rank:
+                return min(BUCKETS[i] if i < len(BUCKETS) else self.max, self.max)
+
+        return self.max
+
+    def toDict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 3),
+            "min": None if self.min is None else round(self.min, 3),
+            "max": None if self.max is None else round(self.max, 3),
+            "p50": round(self.quantile(0.5), 3),
+            "p95": round(self.quantile(0.95), 3),
+        }
+
+
+class Metrics:
+    """Per-endpoint histograms, e.g. ``metrics.record("getAlbum", "bytes", 1234)``."""
+
+    def __init__(self) -> None:
+        self.__histograms: dict[str, dict[str, Histogram]] = {}
+
+    def record(self, endpoint: str, metric: str, value: float) -> None:
+        histograms = self.__histograms.setdefault(endpoint, {})
+        histogram = histograms.get(metric)
+
+        if histogram is None:
+            histogram = histograms[metric] = Histogram()
+
+        histogram.record(value)
+
+    @contextmanager
+    def timer(self, endpoint: str, metric: str) -> Iterator[None]:
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.record(endpoint, metric, (time.perf_counter() - start) * 1000)
+
+    def get(self, endpoint: str, metric: str) -> Histogram | None:
+        return self.__histograms.get(endpoint, {}).get(metric)
+
+    def total(self, metric: str) -> Histogram:
+        """All endpoints merged into one histogram for ``metric``."""
+        merged = Histogram()
+
+        for histograms in self.__histograms.values():
+            histogram = histograms.get(metric)
+
+            if histogram is None or histogram.count == 0:
+                continue
+
+            merged.count += histogram.count
+            merged.total += histogram.total
+            merged.min = histogram.min if merged.min is None else min(merged.min, histogram.min)
+            merged.max = histogram.max if merged.max is None else max(merged.max, histogram.max)
+            merged.buckets = [a + b for a, b in zip(merged.buckets, histogram.buckets)]
+
+        return merged
+
+    def toDict(self) -> dict:
+        return {
+            endpoint: {metric: histogram.toDict() for metric, histogram in histograms.items()}
+            for endpoint, histograms in sorted(self.__histograms.items())
+        }
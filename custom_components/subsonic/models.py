@@ -0,0 +1,188 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Self
+
+
+class Record:
+    """Slotted record with dict-style access.
+
+    Only the fields listed in ``_fields`` get a slot; any other attribute the
+    server sends is kept in a flat key/value tuple and looked up on demand.
+    """
+
+    __slots__ = ("_extra",)
+    _fields: tuple[str, ...] = ()
+    _fieldSet: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fieldSet = frozenset(cls._fields)
+
+    @classmethod
+    def fromDict(cls, item: dict) -> Self:
+        record = cls.__new__(cls)
+
+        for name in cls._fields:
+            setattr(record, name, item.get(name))
+
+        extra = []
+
+        for k, v in item.items():
+            if k not in cls._fieldSet:
+                extra.append(sys.intern(k))
+                extra.append(v)
+
+        record._extra = tuple(extra)
+
+        return record
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fieldSet:
+            value = getattr(self, key)
+
+            if value is None:
+                raise KeyError(key)
+
+            return value
+
+        extra = self._extra
+
+        for i in range(0, len(extra), 2):
+            if extra[i] == key:
+                return extra[i + 1]
+
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._fieldSet:
+            setattr(self, key, value)
+            return
+
+        extra = self._extra
+        pairs = [(extra[i], extra[i + 1]) for i in range(0, len(extra), 2) if extra[i] != key]
+        pairs.append((sys.intern(key), value))
+
+        self._extra = tuple(item for pair in pairs for item in pair)
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._fieldSet:
+            return getattr(self, key) is not None
+
+        return key in self._extra[::2]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Record):
+            return NotImplemented
+
+        return type(self) is type(other) and self.toDict() == other.toDict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.toDict()!r})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> list[str]:
+        keys = [name for name in self._fields if getattr(self, name) is not None]
+        keys.extend(self._extra[::2])
+
+        return keys
+
+    def items(self) -> list[tuple[str, Any]]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def toDict(self) -> dict:
+        return dict(self.items())
+
+
+class Song(Record):
+
+    __slots__ = _fields = (
+        "id",
+        "title",
+        "album",
+        "albumId",
+        "artist",
+        "artistId",
+        "coverArt",
+        "contentType",
+        "suffix",
+        "duration",
+        "track",
+    )
+
+
+class Album(Record):
+
+    __slots__ = _fields = (
+        "id",
+        "name",
+        "artist",
+        "artistId",
+        "coverArt",
+        "songCount",
+        "year",
+        "songs",
+    )
+
+
+class Artist(Record):
+
+    __slots__ = _fields = (
+        "id",
+        "name",
+        "coverArt",
+        "albumCount",
+        "index",
+        "albums",
+    )
+
+
+class Playlist(Record):
+
+    __slots__ = _fields = (
+        "id",
+        "name",
+        "coverArt",
+        "songCount",
+        "songs",
+    )
+
+
+class RadioStation(Record):
+
+    __slots__ = _fields = (
+        "id",
+        "name",
+        "streamUrl",
+    )
+
+
+@dataclass(slots=True)
+class SearchResult:
+
+    artists: list[Artist] = field(default_factory=list)
+    albums: list[Album] = field(default_factory=list)
+    songs: list[Song] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.artists) + len(self.albums) + len(self.songs)
+
+    def merge(self, other: "SearchResult", limit: int) -> "SearchResult":
+        """Records of both results, these first, without repeating an id."""
+        def merged(first: list, second: list) -> list:
+            ids = {record.get("id") for record in first}
+            return (first + [record for record in second if record.get("id") not in ids])[:limit]
+
+        return SearchResult(artists=merged(self.artists, other.artists),
+                            albums=merged(self.albums, other.albums),
+                            songs=merged(self.songs, other.songs))
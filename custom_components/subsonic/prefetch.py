@@ -0,0 +1,124 @@
+import asyncio
+import time
+from collections import Counter, deque
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, \
+    LOGGER, \
+    PREFETCH_BUDGET_PERIOD, \
+    PREFETCH_BYTE_BUDGET, \
+    PREFETCH_CHILDREN, \
+    PREFETCH_CONCURRENCY, \
+    PREFETCH_HISTORY_SIZE
+from .subsonicApi import SubsonicApi
+
+
+class SubsonicPrefetcher:
+    """Warms the API cache for nodes the user is likely to open next.
+
+    After a listing is returned, the first few children and the children
+    opened most often are loaded in the background. At most
+    ``maxConcurrency`` loads run at once, and prefetching pauses once
+    ``byteBudget`` bytes were fetched in the current budget period.
+    """
+
+    def __init__(self,
+                 hass: HomeAssistant,
+                 api: SubsonicApi,
+                 entry: ConfigEntry,
+                 children: int = PREFETCH_CHILDREN,
+                 maxConcurrency: int = PREFETCH_CONCURRENCY,
+                 byteBudget: int = PREFETCH_BYTE_BUDGET,
+                 budgetPeriod: float = PREFETCH_BUDGET_PERIOD) -> None:
+        self.hass = hass
+        self.api = api
+        self.entry = entry
+        self.children = children
+        self.byteBudget = byteBudget
+        self.budgetPeriod = budgetPeriod
+        self.prefetched = 0
+        self.bytesUsed = 0
+        self.__loaders = {
+            "artist": (api.getArtist, "getArtist"),
+            "album": (api.getAlbum, "getAlbum"),
+        }
+        self.__semaphore = asyncio.Semaphore(maxConcurrency)
+        self.__history: deque[tuple[str, str]] = deque(maxlen=PREFETCH_HISTORY_SIZE)
+        self.__opened: Counter[tuple[str, str]] = Counter()
+        self.__tasks: dict[tuple[str, str], asyncio.Task] = {}
+        self.__periodStart = time.monotonic()
+        self.__closed = False
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.entry.options.get("prefetch", False)) and not self.__closed
+
+    def recordOpen(self, kind: str, id: str) -> None:
+        key = (kind, id)
+
+        if len(self.__history) == self.__history.maxlen:
+            oldest = self.__history[0]
+            self.__opened[oldest] -= 1
+
+            if self.__opened[oldest] <= 0:
+                del self.__opened[oldest]
+
+        self.__history.append(key)
+        self.__opened[key] += 1
+
+    def schedule(self, kind: str, ids: list[str]) -> None:
+        if not self.enabled or len(ids) == 0:
+            return
+
+        frequent = sorted((id for id in ids if self.__opened[(kind, id)] > 0),
+                          key=lambda id: self.__opened[(kind, id)],
+                          reverse=True)
+
+        for id in list(dict.fromkeys(frequent + ids[:self.children]))[:self.children * 2]:
+            key = (kind, id)
+
+            if key in self.__tasks or self.__isCached(kind, id):
+                continue
+
+            task = self.entry.async_create_background_task(self.hass,
+                                                           self.__prefetch(kind, id),
+                                                           f"{DOMAIN} prefetch {kind} {id}")
+            self.__tasks[key] = task
+            task.add_done_callback(lambda _, key=key: self.__tasks.pop(key, None))
+
+    def cancel(self) -> None:
+        self.__closed = True
+
+        for task in list(self.__tasks.values()):
+            task.cancel()
+
+        self.__tasks.clear()
+
+    def __isCached(self, kind: str, id: str) -> bool:
+        endpoint = self.__loaders[kind][1]
+        return self.api.cache is not None and self.api.cache.peek(endpoint, (id,)) is not None
+
+    def __hasBudget(self) -> bool:
+        if time.monotonic() - self.__periodStart >= self.budgetPeriod:
+            self.__periodStart = time.monotonic()
+            self.bytesUsed = 0
+
+        return self.bytesUsed < self.byteBudget
+
+    async def __prefetch(self, kind: str, id: str) -> None:
+        async with self.__semaphore:
+            if not self.__hasBudget() or self.__isCached(kind, id):
+                return
+
+            loader = self.__loaders[kind][0]
+
+            try:
+                with self.api.trackBytes() as received:
+                    await loader(id)
+            except Exception as e:
+                LOGGER.debug(f"Prefetch of {kind} {id} failed: {e}")
+                return
+
+            self.prefetched += 1
+            self.bytesUsed += received[0]
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from . import jsonHelper, xmlHelper
+from .models import Album, Artist, Record, SearchResult, Song
+from .xmlHelper import XmlTags
+
+
+@dataclass
+class SubsonicResponse:
+
+    path: str
+    body: bytes
+    isJson: bool
+    contentType: str = ""
+    tags: XmlTags | None = None
+    streamedSize: int = 0
+    streamParseTime: float = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + self.streamedSize
+
+    def decode(self) -> str | dict | XmlTags:
+        if self.tags is not None:
+            return self.tags
+
+        if self.isJson:
+            return jsonHelper.decode(self.body)
+
+        return self.body.decode("utf-8")
+
+
+def _helper(response: str | dict | XmlTags):
+    if isinstance(response, XmlTags):
+        return XmlTags
+
+    return xmlHelper if isinstance(response, str) else jsonHelper
+
+def getTagsAttributesToList(response: str | dict | XmlTags, tag: str) -> list:
+    return _helper(response).getTagsAttributesToList(response, tag)
+
+def getTagAttributes(response: str | dict | XmlTags, tag: str) -> dict:
+    return _helper(response).getTagAttributes(response, tag)
+
+def getAttributes(response: str | dict | XmlTags) -> dict:
+    return _helper(response).getAttributes(response)
+
+def getError(response: str | dict | XmlTags) -> dict | None:
+    """The error of a status="failed" response, or None when it succeeded."""
+    return _helper(response).getError(response)
+
+def getTagsTexts(response: str | dict | XmlTags, tag: str) -> list[str]:
+    return _helper(response).getTagsTexts(response, tag)
+
+def getGroupedTagsAttributes(response: str | dict | XmlTags, groupTag: str, tag: str) -> list[tuple[dict, list]]:
+    return _helper(response).getGroupedTagsAttributes(response, groupTag, tag)
+
+def getRecords(response: str | dict | XmlTags, tag: str, recordType: type[Record]) -> list:
+    return [recordType.fromDict(item) for item in getTagsAttributesToList(response, tag)]
+
+def getGroupedRecords(response: str | dict | XmlTags,
+                      groupTag: str,
+                      tag: str,
+                      recordType: type[Record],
+                      key: str) -> list:
+    """Records of every ``tag`` inside ``groupTag``, with the group name stored under ``key``."""
+    records = []
+
+    for group, items in getGroupedTagsAttributes(response, groupTag, tag):
+        for item in items:
+            record = recordType.fromDict(item)
+            record[key] = group.get("name")
+            records.append(record)
+
+    return records
+
+def getRecord(response: str | dict | XmlTags, tag: str, recordType: type[Record]) -> Record:
+    return recordType.fromDict(getTagAttributes(response, tag))
+
+def getRecordWithChildren(response: str | dict | XmlTags,
+                          tag: str,
+                          recordType: type[Record],
+                          childTag: str,
+                          childType: type[Record],
+                          key: str) -> Record:
+    record = getRecord(response, tag, recordType)
+    record[key] = getRecords(response, childTag, childType)
+
+    return record
+
+def getSearchResult(response: str | dict | XmlTags) -> SearchResult:
+    return SearchResult(artists=getRecords(response, "artist", Artist),
+                        albums=getRecords(response, "album", Album),
+                        songs=getRecords(response, "song", Song))
@@ -0,0 +1,88 @@
+import random
+import time
+from .const import LOGGER
+
+
+class CircuitBreaker:
+    """Stops calling the server after repeated failures.
+
+    After ``failureThreshold`` consecutive failures the breaker opens and
+    every call fails fast for ``resetTimeout`` seconds. Then a single probe
+    is let through; its outcome closes the breaker or opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failureThreshold: int, resetTimeout: float) -> None:
+        self.failureThreshold = failureThreshold
+        self.resetTimeout = resetTimeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.openedAt = 0.0
+        self.__probing = False
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN:
+            if time.monotonic() - self.openedAt < self.resetTimeout:
+                return False
+
+            self.state = self.HALF_OPEN
+            self.__probing = False
+
+        if self.__probing:
+            return False
+
+        self.__probing = True
+        return True
+
+    def recordSuccess(self) -> None:
+        if self.state != self.CLOSED:
+            LOGGER.info("Subsonic server is reachable again, closing circuit breaker")
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.__probing = False
+
+    def releaseProbe(self) -> None:
+        """Count an aborted probe as a failure if it never recorded an outcome."""
+        if self.state == self.HALF_OPEN and self.__probing:
+            self.recordFailure()
+
+    def recordFailure(self) -> None:
+        self.failures += 1
+        self.__probing = False
+
+        if self.state == self.HALF_OPEN or self.failures >= self.failureThreshold:
+            if self.state != self.OPEN:
+                LOGGER.warning(f"Subsonic server failed {self.failures} times, opening circuit breaker")
+
+            self.state = self.OPEN
+            self.openedAt = time.monotonic()
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of the request volume."""
+
+    def __init__(self, ratio: float, capacity: float) -> None:
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+
+    def deposit(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+def backoffDelay(attempt: int, base: float, maximum: float) -> float:
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
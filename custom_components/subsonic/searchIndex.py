@@ -0,0 +1,260 @@
+import re
+import sys
+import unicodedata
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Iterable
+from .models import Record, SearchResult
+
+_WORD = re.compile(r"\w+")
+
+# Above this many changed tokens in one batch, the sorted token list is
+# rebuilt in one pass instead of updated token by token.
+_BULK_TOKENS = 256
+
+_FIELDS: dict[str, tuple[str, ...]] = {
+    "artist": ("name",),
+    "album": ("name", "artist"),
+    "song": ("title", "artist", "album"),
+}
+
+
+def fold(text: str) -> str:
+    if text.isascii():
+        return text.lower()
+
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+def tokenize(text: str) -> list[str]:
+    return _WORD.findall(fold(text))
+
+def recordText(kind: str, record: Record) -> str:
+    # Every indexed field is a slot of its record type.
+    return " ".join(str(getattr(record, f) or "") for f in _FIELDS[kind])
+
+def recordTokens(kind: str, record: Record) -> list[str]:
+    return tokenize(recordText(kind, record))
+
+def matchesTerms(kind: str, record: Record, terms: list[str]) -> bool:
+    """True when every term is a prefix of some token of the record."""
+    tokens = recordTokens(kind, record)
+    return all(any(token.startswith(term) for token in tokens) for term in terms)
+
+
+class SearchIndex:
+    """In-memory inverted index over library records.
+
+    Tokens are accent-folded and kept in a sorted list that is updated
+    after every batch of changes, so every query term is matched as a
+    prefix with a binary search. Postings are kept per kind, and a query walks only those of its
+    most selective term. Artists and albums are replaced per sync; songs
+    are added as the API returns them and the oldest are evicted once
+    ``maxEntries`` is reached.
+    """
+
+    def __init__(self, maxEntries: int) -> None:
+        self.maxEntries = maxEntries
+        self.__docs: OrderedDict[tuple[str, str], tuple[Record, str, tuple[str, ...]]] = OrderedDict()
+        self.__postings: dict[str, dict[str, set[tuple[str, str]]]] = {kind: {} for kind in _FIELDS}
+        self.__keys: dict[str, set[tuple[str, str]]] = {kind: set() for kind in _FIELDS}
+        self.__counts: dict[str, int] = {}
+        self.__tokens: list[str] = []
+        self.__addedTokens: set[str] = set()
+        self.__removedTokens: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.__docs)
+
+    def update(self, kind: str, records: Iterable[Record]) -> int:
+        """Make ``records`` the complete set for ``kind``, returning the number of changes."""
+        current = set(self.__keys[kind])
+        changes = 0
+
+        for record in records:
+            key = (kind, record.get("id"))
+            current.discard(key)
+
+            if self.__add(kind, record):
+                changes += 1
+
+        for key in current:
+            self.__remove(key)
+            changes += 1
+
+        self.__evict()
+        self.__updateTokens()
+        return changes
+
+    def add(self, kind: str, records: Iterable[Record]) -> None:
+        for record in records:
+            self.__add(kind, record)
+
+        self.__evict()
+        self.__updateTokens()
+
+    def search(self, query: str, limit: int) -> SearchResult:
+        terms = list(dict.fromkeys(tokenize(query)))
+        result = SearchResult()
+
+        if len(terms) == 0:
+            return result
+
+        # Only the most selective term is looked up in the postings; the
+        # other terms are checked against the tokens of its candidates.
+        term, tokens = self.__narrowest(terms)
+        others = [t for t in terms if t != term]
+        lists = {"artist": result.artists, "album": result.albums, "song": result.songs}
+
+        for kind, items in lists.items():
+            self.__collect(kind, tokens, others, items, limit)
+
+        return result
+
+    def __collect(self, kind: str, tokens: list[str], others: list[str], items: list, limit: int) -> None:
+        postings = self.__postings[kind]
+        seen: set[tuple[str, str]] = set()
+
+        for token in tokens:
+            for key in postings.get(token, ()):
+                if key in seen:
+                    continue
+
+                seen.add(key)
+                record, _, docTokens = self.__docs[key]
+
+                if all(any(t.startswith(other) for t in docTokens) for other in others):
+                    items.append(record)
+
+                    if len(items) >= limit:
+                        return
+
+    def __narrowest(self, terms: list[str]) -> tuple[str, list[str]]:
+        """The term whose prefix matches the fewest postings, with its tokens."""
+        best = None
+        bestSize = 0
+
+        for term in terms:
+            start = bisect_left(self.__tokens, term)
+            end = bisect_left(self.__tokens, term + "\U0010ffff", start)
+            size = 0
+
+            for i in range(start, end):
+                size += self.__counts[self.__tokens[i]]
+
+                if best is not None and size >= bestSize:
+                    break
+            else:
+                best = (term, self.__tokens[start:end])
+                bestSize = size
+
+        return best
+
+    def __add(self, kind: str, record: Record) -> bool:
+        key = (kind, record.get("id"))
+
+        if key[1] is None:
+            return False
+
+        text = recordText(kind, record)
+        existing = self.__docs.get(key)
+
+        if existing is not None:
+            self.__docs.move_to_end(key)
+
+            # Syncs hand over every record again; only changed text is
+            # tokenised.
+            if existing[1] == text:
+                self.__docs[key] = (record, existing[1], existing[2])
+                return False
+
+            self.__remove(key)
+
+        tokens = tuple(dict.fromkeys(sys.intern(t) for t in tokenize(text)))
+        self.__docs[key] = (record, text, tokens)
+        self.__keys[kind].add(key)
+        postings = self.__postings[kind]
+
+        counts = self.__counts
+
+        for token in tokens:
+            posting = postings.get(token)
+
+            if posting is None:
+                posting = postings[token] = set()
+
+            posting.add(key)
+            count = counts.get(token, 0)
+
+            if count == 0:
+                self.__tokenAdded(token)
+
+            counts[token] = count + 1
+
+        return True
+
+    def __remove(self, key: tuple[str, str]) -> None:
+        _, _, tokens = self.__docs.pop(key)
+        self.__keys[key[0]].discard(key)
+        postings = self.__postings[key[0]]
+
+        counts = self.__counts
+
+        for token in tokens:
+            posting = postings[token]
+            posting.discard(key)
+
+            if len(posting) == 0:
+                del postings[token]
+
+            if counts[token] == 1:
+                del counts[token]
+                self.__tokenRemoved(token)
+            else:
+                counts[token] -= 1
+
+    def __tokenAdded(self, token: str) -> None:
+        if token in self.__removedTokens:
+            self.__removedTokens.discard(token)
+        else:
+            self.__addedTokens.add(token)
+
+    def __tokenRemoved(self, token: str) -> None:
+        if token in self.__addedTokens:
+            self.__addedTokens.discard(token)
+        else:
+            self.__removedTokens.add(token)
+
+    def __updateTokens(self) -> None:
+        """Apply the tokens added and removed by a batch to the sorted list."""
+        added, removed = self.__addedTokens, self.__removedTokens
+        self.__addedTokens, self.__removedTokens = set(), set()
+        tokens = self.__tokens
+
+        if len(removed) > _BULK_TOKENS:
+            tokens[:] = [t for t in tokens if t not in removed]
+        else:
+            for token in removed:
+                del tokens[bisect_left(tokens, token)]
+
+        if len(added) > _BULK_TOKENS:
+            # Two sorted runs; timsort merges them in linear time.
+            tokens.extend(sorted(added))
+            tokens.sort()
+        else:
+            for token in added:
+                insort(tokens, token)
+
+    def __evict(self) -> None:
+        if len(self.__docs) <= self.maxEntries:
+            return
+
+        # Songs are only a cache of what was browsed; drop them first.
+        for key in [k for k in self.__docs if k[0] == "song"]:
+            if len(self.__docs) <= self.maxEntries:
+                return
+
+            self.__remove(key)
+
+        while len(self.__docs) > self.maxEntries:
+            self.__remove(next(iter(self.__docs)))
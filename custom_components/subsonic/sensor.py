@@ -0,0 +1,120 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .data import SubsonicData
+from .subsonicApi import SubsonicApi
+
+
+@dataclass(frozen=True, kw_only=True)
+class SubsonicSensorEntityDescription(SensorEntityDescription):
+
+    value: Callable[[SubsonicApi], float | None]
+    attributes: Callable[[SubsonicApi], dict] | None = None
+
+
+def _metricAttributes(metric: str) -> Callable[[SubsonicApi], dict]:
+    def attributes(api: SubsonicApi) -> dict:
+        return {
+            endpoint: histograms[metric]
+            for endpoint, histograms in api.metrics.toDict().items()
+            if metric in histograms
+        }
+
+    return attributes
+
+
+SENSORS: tuple[SubsonicSensorEntityDescription, ...] = (
+    SubsonicSensorEntityDescription(
+        key="request_time",
+        name="Request time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value=lambda api: round(api.metrics.total("requestTime").mean, 1),
+        attributes=_metricAttributes("requestTime"),
+    ),
+    SubsonicSensorEntityDescription(
+        key="request_errors",
+        name="Request errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=lambda api: api.metrics.total("errors").count,
+        attributes=_metricAttributes("errors"),
+    ),
+    SubsonicSensorEntityDescription(
+        key="parse_time",
+        name="Parse time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value=lambda api: round(api.metrics.total("parseTime").mean, 1),
+        attributes=_metricAttributes("parseTime"),
+    ),
+    SubsonicSensorEntityDescription(
+        key="bytes_received",
+        name="Data received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=lambda api: api.connectionStats["bytesReceived"],
+    ),
+    SubsonicSensorEntityDescription(
+        key="cache_hit_ratio",
+        name="Cache hit ratio",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda api: None if api.cache is None else round(api.cache.hitRatio() * 100, 1),
+    ),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant,
+                            entry: ConfigEntry,
+                            async_add_entities: AddEntitiesCallback) -> None:
+    data: SubsonicData = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(SubsonicSensor(entry, data.api, description) for description in SENSORS)
+
+
+class SubsonicSensor(SensorEntity):
+    """Client-side performance counters, disabled until the user enables them."""
+
+    entity_description: SubsonicSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self,
+                 entry: ConfigEntry,
+                 api: SubsonicApi,
+                 description: SubsonicSensorEntityDescription) -> None:
+        self.api = api
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": entry.title,
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        return self.entity_description.value(self.api)
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        if self.entity_description.attributes is None:
+            return None
+
+        return self.entity_description.attributes(self.api)
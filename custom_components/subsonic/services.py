@@ -0,0 +1,51 @@
+import voluptuous as vol
+
+from homeassistant.components.media_player import BrowseError
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN, SERVICE_SEARCH
+from .media_source import SubsonicSource
+
+SEARCH_SCHEMA = vol.Schema({
+    vol.Required("query"): cv.string,
+    vol.Optional("config_entry_id"): cv.string,
+})
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the search service.
+
+    The media browser has no search box for media sources, so this is the
+    way to reach the Subsonic search; every item can be browsed or played
+    by its media_content_id.
+    """
+
+    async def async_search(call: ServiceCall) -> ServiceResponse:
+        try:
+            items = await SubsonicSource(hass).async_search(call.data["query"],
+                                                            call.data.get("config_entry_id"))
+        except BrowseError as e:
+            raise ServiceValidationError(str(e)) from e
+
+        return {
+            "items": [
+                {
+                    "title": item.title,
+                    "media_class": item.media_class,
+                    "media_content_type": item.media_content_type,
+                    "media_content_id": item.media_content_id,
+                    "can_play": item.can_play,
+                    "can_expand": item.can_expand,
+                    "thumbnail": item.thumbnail,
+                }
+                for item in items
+            ]
+        }
+
+    hass.services.async_register(DOMAIN,
+                                 SERVICE_SEARCH,
+                                 async_search,
+                                 schema=SEARCH_SCHEMA,
+                                 supports_response=SupportsResponse.ONLY)
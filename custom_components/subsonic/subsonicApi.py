@@ -1,16 +1,65 @@
 import socket
 import aiohttp
 import asyncio
-import hashlib
-import secrets
-from typing import Self
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Self
 from aiohttp import hdrs
-from .const import LOGGER
-from dataclasses import dataclass
-from .xmlHelper import getAttributes, \
+from .const import ALBUM_PAGE_SIZE, \
+    CIRCUIT_FAILURE_THRESHOLD, \
+    CIRCUIT_RESET_TIMEOUT, \
+    CLIENT_NAME, \
+    DNS_CACHE_TTL, \
+    GENRE_PAGE_SIZE, \
+    KEEP_ALIVE_TIMEOUT, \
+    LOGGER, \
+    MAX_CONCURRENT_PAGES, \
+    MAX_CONNECTIONS, \
+    MAX_RETRIES, \
+    MAX_TIMEOUT_RETRIES, \
+    RADIO_INDEX_TTL, \
+    RETRY_BACKOFF, \
+    RETRY_BUDGET_CAPACITY, \
+    RETRY_BUDGET_RATIO, \
+    RETRY_MAX_BACKOFF, \
+    SEARCH_PAGE_SIZE, \
+    SONG_INDEX_MAX_ENTRIES, \
+    STREAM_PROFILE_DEFAULT, \
+    STREAM_PROFILES, \
+    TOKEN_POOL_SIZE, \
+    TOKEN_VALIDITY
+from dataclasses import dataclass, field
+from .auth import TokenProvider
+from .cache import ResponseCache, cached
+from .exceptions import SubsonicApiError, SubsonicCircuitOpenError, SubsonicServerError
+from .metrics import Metrics
+from .models import Album, Artist, Playlist, RadioStation, Record, SearchResult, Song
+from .responseHelper import SubsonicResponse, \
+    getAttributes, \
+    getError, \
+    getGroupedRecords, \
+    getRecord, \
+    getRecords, \
+    getRecordWithChildren, \
+    getSearchResult, \
     getTagAttributes, \
-    getTagsAttributesToList, \
     getTagsTexts
+from .retry import CircuitBreaker, RetryBudget, backoffDelay
+from .searchIndex import matchesTerms, tokenize
+from .urlBuilder import UrlBuilder
+from .xmlHelper import XmlStreamParser, XmlTags
+
+
+RETRYABLE_ERRORS = (
+    asyncio.TimeoutError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+)
+RETRYABLE_STATUS = (502, 503, 504)
+
+_trackedBytes: ContextVar[list[int] | None] = ContextVar("subsonic_tracked_bytes", default=None)
 
 
 @dataclass
@@ -20,7 +69,41 @@ class SubsonicApi:
     config: dict
     requestTimeout: float = 8.0
     apiVersion: str = "1.16.1"
+    responseFormat: str = "json"
+    parseInlineThreshold: int = 64 * 1024
+    streamChunkSize: int = 64 * 1024
     session: aiohttp.client.ClientSession | None = None
+    executor: Callable[..., Awaitable[Any]] | None = None
+    metrics: Metrics = field(default_factory=Metrics)
+    cache: ResponseCache | None = field(default_factory=ResponseCache)
+    songIndexMaxEntries: int = SONG_INDEX_MAX_ENTRIES
+    songIndex: OrderedDict = field(default_factory=OrderedDict, repr=False)
+    songListeners: list[Callable[[list[Song]], None]] = field(default_factory=list)
+    radioIndexTtl: float = RADIO_INDEX_TTL
+    radioIndex: dict = field(default_factory=dict, repr=False)
+    radioIndexUpdated: float = 0.0
+    maxConnections: int = MAX_CONNECTIONS
+    dnsCacheTtl: int = DNS_CACHE_TTL
+    keepAliveTimeout: float = KEEP_ALIVE_TIMEOUT
+    connectionStats: dict = field(default_factory=lambda: {
+        "requests": 0,
+        "connectionsCreated": 0,
+        "connectionsReused": 0,
+        "bytesReceived": 0
+    })
+    maxRetries: int = MAX_RETRIES
+    maxTimeoutRetries: int = MAX_TIMEOUT_RETRIES
+    retryBackoff: float = RETRY_BACKOFF
+    retryMaxBackoff: float = RETRY_MAX_BACKOFF
+    retryBudget: RetryBudget = field(default_factory=lambda: RetryBudget(RETRY_BUDGET_RATIO,
+                                                                         RETRY_BUDGET_CAPACITY))
+    circuitBreaker: CircuitBreaker = field(default_factory=lambda: CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD,
+                                                                                  CIRCUIT_RESET_TIMEOUT))
+    tokenValidity: float = TOKEN_VALIDITY
+    tokenPoolSize: int = TOKEN_POOL_SIZE
+    _tokenProvider: TokenProvider | None = field(default=None, init=False, repr=False)
+    _urlBuilder: UrlBuilder | None = field(default=None, init=False, repr=False)
+    _close_session: bool = field(default=False, init=False, repr=False)
         
     @property
     def url(self) -> str:
@@ -35,8 +118,29 @@ class SubsonicApi:
         return self.__getProperty("password")
 
     @property
-    def salt(self) -> str:
-        return secrets.token_hex(5)
+    def apiKey(self) -> str | None:
+        return self.__getProperty("api_key")
+
+    @property
+    def tokenProvider(self) -> TokenProvider:
+        if self._tokenProvider is None:
+            self._tokenProvider = TokenProvider(self.user,
+                                                self.password,
+                                                validity=self.tokenValidity,
+                                                poolSize=self.tokenPoolSize,
+                                                apiKey=self.apiKey)
+
+        return self._tokenProvider
+
+    @property
+    def urlBuilder(self) -> UrlBuilder:
+        if self._urlBuilder is None:
+            self._urlBuilder = UrlBuilder(self.url,
+                                          self.tokenProvider,
+                                          apiVersion=self.apiVersion,
+                                          client=CLIENT_NAME)
+
+        return self._urlBuilder
     
     def __getProperty(self, property, dafultValue=None):
         if self.config is None:
@@ -47,35 +151,130 @@ class SubsonicApi:
         
         return self.config[property]
 
-    def __generateToken(self, password: str, salt: str) -> str:
-        return hashlib.md5((password + salt).encode()).hexdigest()
-
     def __getSession(self):
         if self.session is None:
-            self.session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(limit=self.maxConnections,
+                                             limit_per_host=self.maxConnections,
+                                             ttl_dns_cache=self.dnsCacheTtl,
+                                             keepalive_timeout=self.keepAliveTimeout)
+
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 trace_configs=[self.__createTraceConfig()])
             self._close_session = True
         
         return self.session
+
+    def __createTraceConfig(self) -> aiohttp.TraceConfig:
+        stats = self.connectionStats
+        traceConfig = aiohttp.TraceConfig()
+
+        async def onRequestStart(session, context, params):
+            stats["requests"] += 1
+
+        async def onConnectionCreated(session, context, params):
+            stats["connectionsCreated"] += 1
+
+        async def onConnectionReused(session, context, params):
+            stats["connectionsReused"] += 1
+
+        traceConfig.on_request_start.append(onRequestStart)
+        traceConfig.on_connection_create_end.append(onConnectionCreated)
+        traceConfig.on_connection_reuseconn.append(onConnectionReused)
+
+        return traceConfig
     
-    def __getRequestParams(self, params):
-        s = self.salt
-
-        p = {
-            "u": self.user,
-            "t": self.__generateToken(self.password, s),
-            "s": s,
-            "v": self.apiVersion,
-            "c": "HomeAssistant"
-        }
+    def __getRequestParams(self, params, responseFormat=None):
+        p = dict(self.tokenProvider.getAuthParams())
+        p["v"] = self.apiVersion
+        p["c"] = CLIENT_NAME
+
+        if responseFormat is not None:
+            p["f"] = responseFormat
 
         if params is not None:
             p.update(params)
 
         return p
 
-    async def __request(self, method, path, params=None):
+    async def __request(self, method, path, params=None, streamTags=None):
+        if not self.circuitBreaker.allow():
+            raise SubsonicCircuitOpenError("Subsonic server unavailable, failing fast")
+
+        probe = self.circuitBreaker.state == CircuitBreaker.HALF_OPEN
+
+        self.retryBudget.deposit()
+        attempt = 0
+        timeouts = 0
+        start = time.perf_counter()
+
+        try:
+            while True:
+                attemptStart = time.perf_counter()
+
+                try:
+                    response = await self.__requestOnce(method, path, params, streamTags)
+                except SubsonicApiError as exception:
+                    self.metrics.record(path, "errors", (time.perf_counter() - attemptStart) * 1000)
+                    status = getattr(exception.__cause__, "status", None)
+                    retryable = isinstance(exception.__cause__, RETRYABLE_ERRORS) \
+                        or status in RETRYABLE_STATUS
+
+                    if not retryable:
+                        # Only a 4xx shows the server itself is healthy; a 5xx
+                        # or a DNS failure counts against it.
+                        if status is not None and 400 <= status < 500:
+                            self.circuitBreaker.recordSuccess()
+                        else:
+                            self.circuitBreaker.recordFailure()
+
+                        LOGGER.error(f"{exception} ({path})")
+                        raise
+
+                    # A server that timed out once is likely to do it again;
+                    # keep the wait bounded so the breaker can open quickly.
+                    if isinstance(exception.__cause__, asyncio.TimeoutError):
+                        timeouts += 1
+
+                    if (method != "GET"
+                        or attempt >= self.maxRetries
+                        or timeouts > self.maxTimeoutRetries
+                        or not self.retryBudget.withdraw()):
+                        self.circuitBreaker.recordFailure()
+                        LOGGER.error(f"{exception} ({path})")
+                        raise
+
+                    delay = backoffDelay(attempt, self.retryBackoff, self.retryMaxBackoff)
+                    attempt += 1
+                    LOGGER.debug(f"{exception} ({path}), retry {attempt} in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+                    continue
+
+                self.circuitBreaker.recordSuccess()
+                break
+        except BaseException as exception:
+            # A probe cancelled before it recorded an outcome would otherwise
+            # keep the breaker half-open, rejecting every call, forever.
+            if probe:
+                self.circuitBreaker.releaseProbe()
+
+            if isinstance(exception, SubsonicApiError):
+                self.metrics.record(path, "requestTime", (time.perf_counter() - start) * 1000)
+
+            raise
+
+        self.connectionStats["bytesReceived"] += response.size
+        self.metrics.record(path, "requestTime", (time.perf_counter() - start) * 1000)
+        self.metrics.record(path, "bytes", response.size)
+        tracked = _trackedBytes.get()
+
+        if tracked is not None:
+            tracked[0] += response.size
+
+        return response
+
+    async def __requestOnce(self, method, path, params=None, streamTags=None):
         url = f"{self.url}/rest/{path}.view"
-        p = self.__getRequestParams(params)
+        p = self.__getRequestParams(params, self.responseFormat)
 
         headers = {
             hdrs.USER_AGENT: self.userAgent
@@ -92,20 +291,126 @@ class SubsonicApi:
                                         raise_for_status=True)
                 
                 content_type = response.headers.get("Content-Type", "")
+                isJson = "json" in content_type
+
+                if "xml" in content_type and self.responseFormat == "json":
+                    LOGGER.info("Server does not support JSON responses, falling back to XML")
+                    self.responseFormat = "xml"
 
-                if "application/json" in content_type:
-                    return await response.json()
-                else:
-                    text = await response.text()
-                    return text
+                if not isJson and streamTags is not None:
+                    return await self.__readStream(path, response, streamTags)
+
+                body = await response.read()
+                return SubsonicResponse(path, body, isJson, contentType=content_type)
                 
         except asyncio.TimeoutError as exception:
-            LOGGER.error("Timeout error")
-            raise Exception("Timeout error") from exception
+            raise SubsonicApiError("Timeout error") from exception
         
         except (aiohttp.ClientError, socket.gaierror) as exception:
-            LOGGER.error("Error connecting to Navidrome")
-            raise Exception("Error connecting to Navidrome") from exception
+            raise SubsonicApiError("Error connecting to Navidrome") from exception
+
+    async def __readStream(self, path, response, tags) -> SubsonicResponse:
+        parser = XmlStreamParser(*tags)
+        items = XmlTags({tag: [] for tag in parser.tags})
+        size = 0
+        elapsed = 0.0
+
+        async for chunk in response.content.iter_chunked(self.streamChunkSize):
+            size += len(chunk)
+            start = time.perf_counter()
+
+            for tag, attrs in parser.feed(chunk):
+                items[tag].append(attrs)
+
+            elapsed += time.perf_counter() - start
+
+        start = time.perf_counter()
+
+        for tag, attrs in parser.close():
+            items[tag].append(attrs)
+
+        elapsed += time.perf_counter() - start
+
+        return SubsonicResponse(path, b"", False,
+                                tags=items,
+                                streamedSize=size,
+                                streamParseTime=elapsed)
+
+    def __timedParse(self, response: SubsonicResponse, parser, *args):
+        start = time.perf_counter()
+        decoded = response.decode()
+        error = getError(decoded)
+
+        # Raised before the result reaches the cache or the library snapshot.
+        if error is not None:
+            raise SubsonicServerError(error.get("code"), error.get("message"))
+
+        result = parser(decoded, *args)
+
+        return result, time.perf_counter() - start
+
+    async def __runInExecutor(self, func, *args):
+        if self.executor is not None:
+            return await self.executor(func, *args)
+
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def __parse(self, response: SubsonicResponse, parser, *args):
+        # Streamed XML is tokenised chunk by chunk as it arrives, but building
+        # the records of a large reply still goes to the executor.
+        if response.size > self.parseInlineThreshold:
+            result, elapsed = await self.__runInExecutor(self.__timedParse, response, parser, *args)
+        else:
+            result, elapsed = self.__timedParse(response, parser, *args)
+
+        elapsed += response.streamParseTime
+
+        self.metrics.record(response.path, "parseTime", elapsed * 1000)
+
+        if isinstance(result, (list, SearchResult)):
+            self.metrics.record(response.path, "items", len(result))
+        elif isinstance(result, Record):
+            children = result.get("songs", result.get("albums"))
+
+            if children is not None:
+                self.metrics.record(response.path, "items", len(children))
+
+        LOGGER.debug(f"Parsed {response.path} ({response.size} bytes) in {elapsed * 1000:.1f} ms")
+
+        return result
+
+    @contextmanager
+    def trackBytes(self) -> Iterator[list[int]]:
+        """Count the response bytes of requests made inside the block, including cache loads it starts."""
+        counter = [0]
+        token = _trackedBytes.set(counter)
+
+        try:
+            yield counter
+        finally:
+            _trackedBytes.reset(token)
+
+    def invalidateCache(self, endpoint: str | None = None) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+
+    def primeCache(self, endpoint: str, params: tuple, value) -> None:
+        if self.cache is not None:
+            self.cache.set(endpoint, params, value)
+
+    def __indexSongs(self, songs: list[Song]) -> None:
+        for song in songs:
+            if "id" not in song:
+                continue
+
+            self.songIndex[song["id"]] = song
+            self.songIndex.move_to_end(song["id"])
+
+        while len(self.songIndex) > self.songIndexMaxEntries:
+            self.songIndex.popitem(last=False)
+
+        for listener in self.songListeners:
+            listener(songs)
 
     async def close(self) -> None:
         """Close open client session."""
@@ -115,7 +420,12 @@ class SubsonicApi:
     async def ping(self) -> bool:
         pingResponse = await self.__request("GET", "ping")
 
-        ping = getAttributes(pingResponse)
+        try:
+            ping = await self.__parse(pingResponse, getAttributes)
+        except SubsonicServerError as exception:
+            LOGGER.error(f"Ping failed: {exception}")
+            return False
+
         LOGGER.info(f"Ping: {ping}")
 
         if "status" not in ping:
@@ -123,116 +433,270 @@ class SubsonicApi:
         
         return ping["status"] == "ok"
     
-    async def getRadioStations(self) -> dict:
+    @cached("getInternetRadioStations")
+    async def getRadioStations(self) -> list[RadioStation]:
         radioResponse = await self.__request("GET", "getInternetRadioStations")
-        radios = getTagsAttributesToList(radioResponse, "internetRadioStation")
+        radios = await self.__parse(radioResponse, getRecords, "internetRadioStation", RadioStation)
+
+        self.radioIndex = {str(radio["id"]): radio for radio in radios if "id" in radio}
+        self.radioIndexUpdated = time.monotonic()
 
         return radios
+
+    async def getRadioStation(self, id: str) -> RadioStation | None:
+        # One refresh covers both a stale index and a station added since
+        # the last refresh.
+        if (time.monotonic() - self.radioIndexUpdated > self.radioIndexTtl
+            or id not in self.radioIndex):
+            self.invalidateCache("getInternetRadioStations")
+            await self.getRadioStations()
+
+        return self.radioIndex.get(id)
     
-    async def getAlbums(self) -> list:
+    @cached("getAlbumList2")
+    async def getAlbumsPage(self, offset: int = 0, size: int = ALBUM_PAGE_SIZE) -> list[Album]:
         params = {
-            "type": "alphabeticalByName"
+            "type": "alphabeticalByName",
+            "size": size,
+            "offset": offset
         }
-        albumsResponse = await self.__request("GET", "getAlbumList2", params)
-        albums = getTagsAttributesToList(albumsResponse, "album")
+        albumsResponse = await self.__request("GET", "getAlbumList2", params, ["album"])
+        albums = await self.__parse(albumsResponse, getRecords, "album", Album)
 
         return albums
+
+    async def iterAlbums(self,
+                         pageSize: int = ALBUM_PAGE_SIZE,
+                         maxConcurrency: int = MAX_CONCURRENT_PAGES) -> AsyncIterator[Album]:
+        pending = deque()
+        offset = 0
+
+        try:
+            while True:
+                while len(pending) < maxConcurrency:
+                    pending.append(asyncio.create_task(self.getAlbumsPage(offset, pageSize)))
+                    offset += pageSize
+
+                page = await pending.popleft()
+
+                for album in page:
+                    yield album
+
+                if len(page) < pageSize:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def getAlbums(self) -> list[Album]:
+        return [album async for album in self.iterAlbums()]
     
-    async def getAlbum(self, id: str) -> dict:
+    @cached("getAlbum")
+    async def getAlbum(self, id: str) -> Album:
         params = {
             "id": id
         }
         albumResponse = await self.__request("GET", "getAlbum", params)
-        album = getTagAttributes(albumResponse, "album")
-
-        songs = getTagsAttributesToList(albumResponse, "song")
-        album["songs"] = songs
+        album = await self.__parse(albumResponse, getRecordWithChildren, "album", Album, "song", Song, "songs")
+        self.__indexSongs(album["songs"])
 
         return album
 
-    async def getPlaylists(self) -> list:
+    @cached("getPlaylists")
+    async def getPlaylists(self) -> list[Playlist]:
         playlistsResponse = await self.__request("GET", "getPlaylists")
-        playlists = getTagsAttributesToList(playlistsResponse, "playlist")
+        playlists = await self.__parse(playlistsResponse, getRecords, "playlist", Playlist)
 
         return playlists
     
-    async def getPlaylist(self, id: str) -> dict:
+    @cached("getPlaylist")
+    async def getPlaylist(self, id: str) -> Playlist:
         params = {
             "id": id
         }
-        playlistResponse = await self.__request("GET", "getPlaylist", params)
-        playlist = getTagAttributes(playlistResponse, "playlist")
-
-        songs = getTagsAttributesToList(playlistResponse, "entry")
-        playlist["songs"] = songs
+        playlistResponse = await self.__request("GET", "getPlaylist", params, ["playlist", "entry"])
+        playlist = await self.__parse(playlistResponse, getRecordWithChildren, "playlist", Playlist, "entry", Song, "songs")
+        self.__indexSongs(playlist["songs"])
 
         return playlist
 
+    @cached("getGenres")
     async def getGenres(self) -> list[str]:
         genresResponse = await self.__request("GET", "getGenres")
-        genres = getTagsTexts(genresResponse, "genre")
+        genres = await self.__parse(genresResponse, getTagsTexts, "genre")
         return genres
     
-    async def getSongsByGenre(self, id: str) -> list:
+    @cached("getSongsByGenre")
+    async def getSongsByGenre(self, id: str, count: int = GENRE_PAGE_SIZE, offset: int = 0) -> list[Song]:
         params = {
-            "genre": id
+            "genre": id,
+            "count": count,
+            "offset": offset
         }
-        songsResponse = await self.__request("GET", "getSongsByGenre", params)
-        songs = getTagsAttributesToList(songsResponse, "song")
+        songsResponse = await self.__request("GET", "getSongsByGenre", params, ["song"])
+        songs = await self.__parse(songsResponse, getRecords, "song", Song)
+        self.__indexSongs(songs)
 
         return songs
     
-    async def getArtists(self) -> list:
+    @cached("getArtists")
+    async def getArtists(self) -> list[Artist]:
         artistsResponse = await self.__request("GET", "getArtists")
-        artists = getTagsAttributesToList(artistsResponse, "artist")
+        artists = await self.__parse(artistsResponse, getGroupedRecords, "index", "artist", Artist, "index")
 
         return artists
     
-    async def getArtist(self, id: str) -> dict:
+    @cached("getArtist")
+    async def getArtist(self, id: str) -> Artist:
         params = {
             "id": id
         }
         
         artistResponse = await self.__request("GET", "getArtist", params)
-        artist = getTagAttributes(artistResponse, "artist")
-
-        albums = getTagsAttributesToList(artistResponse, "album")
-        artist["albums"] = albums
+        artist = await self.__parse(artistResponse, getRecordWithChildren, "artist", Artist, "album", Album, "albums")
 
         return artist
 
-    async def getSong(self, id: str) -> dict:
+    @cached("search3")
+    async def search3(self,
+                      query: str,
+                      artistCount: int = SEARCH_PAGE_SIZE,
+                      artistOffset: int = 0,
+                      albumCount: int = SEARCH_PAGE_SIZE,
+                      albumOffset: int = 0,
+                      songCount: int = SEARCH_PAGE_SIZE,
+                      songOffset: int = 0) -> SearchResult:
         params = {
-            "id": id
+            "query": query,
+            "artistCount": artistCount,
+            "artistOffset": artistOffset,
+            "albumCount": albumCount,
+            "albumOffset": albumOffset,
+            "songCount": songCount,
+            "songOffset": songOffset
         }
-        songResponse = await self.__request("GET", "getSong", params)
-        song = getTagAttributes(songResponse, "song")
 
-        return song
+        searchResponse = await self.__request("GET", "search3", params, ["artist", "album", "song"])
+        result = await self.__parse(searchResponse, getSearchResult)
+        self.__indexSongs(result.songs)
+
+        return result
+
+    async def search(self, query: str, count: int = SEARCH_PAGE_SIZE, offset: int = 0) -> SearchResult:
+        """One page of search3 results, narrowed locally when possible.
+
+        While typing, a complete first page for a shorter prefix of the query
+        already holds every match, so it is filtered instead of asking the
+        server again. Like search3, every query term has to match the start
+        of a word in one of the record's fields.
+        """
+        query = query.strip()
+
+        if offset == 0:
+            narrowed = self.__narrowSearch(query, count)
 
-    def getCoverArtUrl(self, id: str) -> str:
+            if narrowed is not None:
+                return narrowed
+
+        return await self.search3(query, count, offset, count, offset, count, offset)
+
+    def __narrowSearch(self, query: str, count: int) -> SearchResult | None:
+        if self.cache is None:
+            return None
+
+        terms = tokenize(query)
+
+        for end in range(len(query) - 1, 0, -1):
+            params = (query[:end], count, 0, count, 0, count, 0)
+            result = self.cache.peek("search3", params)
+
+            if result is None:
+                continue
+
+            if max(len(result.artists), len(result.albums), len(result.songs)) >= count:
+                return None
+
+            # Not written back to the cache: a narrowed page is only as good
+            # as the local approximation of the server's matching.
+            return SearchResult(
+                artists=[a for a in result.artists if matchesTerms("artist", a, terms)],
+                albums=[a for a in result.albums if matchesTerms("album", a, terms)],
+                songs=[s for s in result.songs if matchesTerms("song", s, terms)]
+            )
+
+        return None
+
+    async def getSongInfo(self, id: str) -> Song:
+        song = self.songIndex.get(id)
+
+        if song is not None:
+            self.songIndex.move_to_end(id)
+            return song
+
+        return await self.getSong(id)
+
+    async def getScanStatus(self) -> dict:
+        scanResponse = await self.__request("GET", "getScanStatus")
+        scanStatus = await self.__parse(scanResponse, getTagAttributes, "scanStatus")
+
+        return scanStatus
+
+    async def getIndexesLastModified(self, ifModifiedSince: int = 0) -> int:
+        params = {
+            "ifModifiedSince": ifModifiedSince
+        }
+
+        indexesResponse = await self.__request("GET", "getIndexes", params)
+        indexes = await self.__parse(indexesResponse, getTagAttributes, "indexes")
+
+        return int(indexes.get("lastModified") or 0)
+
+    async def getCoverArt(self, id: str, size: int | None = None) -> tuple[bytes, str] | None:
         params = {
             "id": id
         }
 
-        p = self.__getRequestParams(params)
+        if size is not None:
+            params["size"] = size
+
+        coverResponse = await self.__request("GET", "getCoverArt", params)
 
-        query = "&".join([f"{k}={v}" for k, v in p.items()])
-        url = f"{self.url}/rest/getCoverArt.view?{query}"
+        if not coverResponse.contentType.startswith("image/"):
+            return None
 
-        return url
+        return coverResponse.body, coverResponse.contentType
 
-    def getSongStreamUrl(self, id: str) -> str:
+    @cached("getSong")
+    async def getSong(self, id: str) -> Song:
         params = {
             "id": id
         }
+        songResponse = await self.__request("GET", "getSong", params)
+        song = await self.__parse(songResponse, getRecord, "song", Song)
+
+        return song
+
+    def getSongStreamUrl(self, id: str, profile: str = STREAM_PROFILE_DEFAULT) -> str:
+        return self.urlBuilder.build("stream", id, **self.__getStreamParams(profile))
+
+    @staticmethod
+    def getStreamContentType(profile: str, song: dict | None = None) -> str:
+        contentType = STREAM_PROFILES.get(profile, STREAM_PROFILES[STREAM_PROFILE_DEFAULT])["contentType"]
+
+        if contentType is None and song is not None:
+            contentType = song.get("contentType")
 
-        p = self.__getRequestParams(params)
+        return contentType or "audio/mpeg"
 
-        query = "&".join([f"{k}={v}" for k, v in p.items()])
-        url = f"{self.url}/rest/stream.view?{query}"
+    @staticmethod
+    def __getStreamParams(profile: str) -> dict:
+        if profile not in STREAM_PROFILES:
+            LOGGER.warning(f"Unknown stream profile {profile}, using {STREAM_PROFILE_DEFAULT}")
+            profile = STREAM_PROFILE_DEFAULT
 
-        return url
+        return STREAM_PROFILES[profile]["params"]
 
 
     async def __aenter__(self) -> Self:
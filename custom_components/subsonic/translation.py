@@ -5,7 +5,9 @@ LANGUAGES = {
         "tracks": "Tracks",
         "playlists": "Playlists",
         "radios": "Radios",
-        "genres": "Genres"
+        "genres": "Genres",
+        "next_page": "Next page",
+        "search": "Search"
     },
     "pt-BR": {
         "artists": "Artistas",
@@ -13,7 +15,9 @@ LANGUAGES = {
         "tracks": "Músicas",
         "playlists": "Playlists",
         "radios": "Rádios",
-        "genres": "Gêneros"
+        "genres": "Gêneros",
+        "next_page": "Próxima página",
+        "search": "Busca"
     }
 }
 
@@ -0,0 +1,57 @@
+from urllib.parse import quote, urlencode
+from .auth import TokenProvider
+
+
+class UrlBuilder:
+    """Builds signed media URLs from a pre-encoded per-token prefix."""
+
+    def __init__(self,
+                 url: str,
+                 tokenProvider: TokenProvider,
+                 apiVersion: str,
+                 client: str,
+                 maxPrefixes: int = 64) -> None:
+        self.url = url
+        self.tokenProvider = tokenProvider
+        self.apiVersion = apiVersion
+        self.client = client
+        self.maxPrefixes = maxPrefixes
+        self.__prefixes: dict[tuple[str, int], tuple[dict, str]] = {}
+        self.__suffixes: dict[tuple, str] = {}
+
+    def build(self, endpoint: str, id: str, **params) -> str:
+        return f"{self.__getPrefix(endpoint)}&id={quote(str(id), safe='')}{self.__encode(params)}"
+
+    def __getPrefix(self, endpoint: str) -> str:
+        auth = self.tokenProvider.getAuthParams()
+
+        key = (endpoint, id(auth))
+        cached = self.__prefixes.get(key)
+
+        if cached is not None and cached[0] is auth:
+            return cached[1]
+
+        if len(self.__prefixes) >= self.maxPrefixes:
+            self.__prefixes.clear()
+
+        query = urlencode({**auth, "v": self.apiVersion, "c": self.client}, quote_via=quote)
+        prefix = f"{self.url}/rest/{endpoint}.view?{query}"
+        self.__prefixes[key] = (auth, prefix)
+
+        return prefix
+
+    def __encode(self, params: dict) -> str:
+        key = tuple(params.items())
+        suffix = self.__suffixes.get(key)
+
+        if suffix is not None:
+            return suffix
+
+        if len(self.__suffixes) >= self.maxPrefixes:
+            self.__suffixes.clear()
+
+        params = {k: v for k, v in params.items() if v is not None}
+        suffix = "" if len(params) == 0 else "&" + urlencode(params, quote_via=quote)
+        self.__suffixes[key] = suffix
+
+        return suffix
@@ -0,0 +1,51 @@
+from http import HTTPStatus
+from aiohttp import hdrs, web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import COVER_CACHE_MAX_AGE, COVER_VIEW_URL, DOMAIN, LOGGER
+
+
+class SubsonicCoverView(HomeAssistantView):
+    """Serve cached cover art thumbnails for the media browser."""
+
+    url = COVER_VIEW_URL
+    name = "api:subsonic:cover"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+
+    async def get(self, request: web.Request, entryId: str, coverId: str) -> web.StreamResponse:
+        data = self.hass.data.get(DOMAIN, {}).get(entryId)
+
+        if data is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        coverCache = data.coverCache
+
+        if not coverCache.verify(coverId, request.query.get("sig", "")):
+            return web.Response(status=HTTPStatus.FORBIDDEN)
+
+        size = request.query.get("size")
+        size = int(size) if size is not None and size.isdigit() else None
+
+        try:
+            cover = await coverCache.async_get(coverId, size)
+        except Exception as e:
+            LOGGER.warning(f"Could not load cover {coverId}: {e}")
+            return web.Response(status=HTTPStatus.BAD_GATEWAY)
+
+        if cover is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        content, contentType, etag = cover
+        headers = {
+            hdrs.ETAG: etag,
+            hdrs.CACHE_CONTROL: f"private, max-age={COVER_CACHE_MAX_AGE}",
+        }
+
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        return web.Response(body=content, content_type=contentType, headers=headers)
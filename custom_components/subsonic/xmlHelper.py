@@ -1,30 +1,141 @@
+import re
 import xml.etree.ElementTree as ET
+from typing import Iterator
 from .const import LOGGER
 
+_GROUP_TAG = "index"
+_ROOT_TAG = "subsonic-response"
+_ERROR_TAG = "error"
+_ROOT_STATUS = re.compile(r'<subsonic-response\b[^>]*?\bstatus="([^"]*)"')
+
+def _localName(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+def _isRecordPath(ancestors: list[str]) -> bool:
+    # Same containers as jsonHelper: the payload element, its items and the
+    # artist index groups. Deeper elements (song contributors) are skipped.
+    return len(ancestors) <= 2 or (len(ancestors) == 3 and ancestors[-1] == _GROUP_TAG)
+
+def _findTags(root: ET.Element, tag: str) -> Iterator[ET.Element]:
+    for node in root:
+        if _localName(node.tag) == tag:
+            yield node
+            continue
+
+        for item in node:
+            name = _localName(item.tag)
+
+            if name == tag:
+                yield item
+            elif name == _GROUP_TAG:
+                yield from (child for child in item if _localName(child.tag) == tag)
+
 def getTagsAttributesToList(xml: str, tag: str) -> list:
-    xml = xml.replace("xmlns=\"http://subsonic.org/restapi\"", "")
     root = ET.fromstring(xml)
-    tagsItens = root.findall(f'.//{tag}')
-    itens = [{attr: item.get(attr) for attr in item.keys()} for item in tagsItens]
+    itens = [dict(item.attrib) for item in _findTags(root, tag)]
 
     return itens
 
 def getTagAttributes(xml: str, tag: str) -> dict:
-    itens = getTagsAttributesToList(xml, tag)
+    root = ET.fromstring(xml)
+    item = next(_findTags(root, tag), None)
 
-    if len(itens) == 0:
+    if item is None:
         return {}
-    
-    return itens[0]
+
+    return dict(item.attrib)
 
 def getAttributes(xml: str) -> dict:
     root = ET.fromstring(xml)
-    return {attr: root.get(attr) for attr in root.keys()}
+    return dict(root.attrib)
+
+def getError(xml: str) -> dict | None:
+    # The status sits on the root start tag; only parse the body on failure.
+    status = _ROOT_STATUS.search(xml, 0, 2048)
+
+    if status is None or status.group(1) == "ok":
+        return None
+
+    return getTagAttributes(xml, _ERROR_TAG)
 
 def getTagsTexts(xml: str, tag: str) -> list[str]:
-    xml = xml.replace("xmlns=\"http://subsonic.org/restapi\"", "")
     root = ET.fromstring(xml)
-    tagsItens = root.findall(f'.//{tag}')
-    itens = [item.text for item in tagsItens]
+    itens = [item.text for item in _findTags(root, tag)]
+
+    return itens
+
+def getGroupedTagsAttributes(xml: str, groupTag: str, tag: str) -> list[tuple[dict, list]]:
+    root = ET.fromstring(xml)
+
+    return [
+        (dict(group.attrib), [dict(item.attrib) for item in group if _localName(item.tag) == tag])
+        for group in _findTags(root, groupTag)
+    ]
+
+
+class XmlTags(dict):
+    """Attributes of streamed elements, grouped by tag name."""
+
+    @staticmethod
+    def getTagsAttributesToList(tags: "XmlTags", tag: str) -> list:
+        return tags.get(tag, [])
+
+    @staticmethod
+    def getTagAttributes(tags: "XmlTags", tag: str) -> dict:
+        itens = tags.get(tag, [])
+
+        if len(itens) == 0:
+            return {}
+
+        return itens[0]
+
+    @staticmethod
+    def getError(tags: "XmlTags") -> dict | None:
+        if XmlTags.getTagAttributes(tags, _ROOT_TAG).get("status", "ok") == "ok":
+            return None
+
+        return XmlTags.getTagAttributes(tags, _ERROR_TAG)
+
+
+class XmlStreamParser:
+    """Incremental parser that collects the attributes of the given tags,
+    plus the response root and its error, if any.
+
+    Elements are detached from the tree as soon as they are closed, so
+    memory stays bounded by the nesting depth instead of the document size.
+    """
+
+    def __init__(self, *tags: str) -> None:
+        self.tags = {*tags, _ROOT_TAG, _ERROR_TAG}
+        self.__parser = ET.XMLPullParser(events=("start", "end"))
+        self.__stack: list[ET.Element] = []
+        self.__path: list[str] = []
+
+    def feed(self, chunk: bytes) -> list[tuple[str, dict]]:
+        self.__parser.feed(chunk)
+        return self.__readEvents()
+
+    def close(self) -> list[tuple[str, dict]]:
+        self.__parser.close()
+        return self.__readEvents()
+
+    def __readEvents(self) -> list[tuple[str, dict]]:
+        itens = []
+
+        for event, element in self.__parser.read_events():
+            if event == "start":
+                self.__stack.append(element)
+                self.__path.append(_localName(element.tag))
+                continue
+
+            self.__stack.pop()
+            tag = self.__path.pop()
+
+            if tag in self.tags and _isRecordPath(self.__path):
+                itens.append((tag, dict(element.attrib)))
+
+            if len(self.__stack) > 0:
+                element.clear()
+                self.__stack[-1].remove(element)
 
-    return itens
\ No newline at end of file
+        return itens
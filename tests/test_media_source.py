@@ -0,0 +1,92 @@
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.components.media_player import SearchMediaQuery
+
+from custom_components.subsonic.const import DOMAIN
+from custom_components.subsonic.coverCache import CoverArtCache
+from custom_components.subsonic.media_source import SubsonicServerSource
+from custom_components.subsonic.metrics import Metrics
+from custom_components.subsonic.models import Album, SearchResult, Song
+
+ENTRY_ID = "entry"
+
+
+def _makeSource(album: dict | None = None) -> tuple[SubsonicServerSource, CoverArtCache]:
+    hass = MagicMock()
+    hass.config.path = lambda *parts: "/".join(("/config",) + parts)
+    hass.config.language = "en"
+
+    api = MagicMock(password="password", apiKey=None, metrics=Metrics())
+    api.tokenProvider.generated = 0
+    api.getAlbum = AsyncMock(return_value=album)
+
+    coverCache = CoverArtCache(hass, api, ENTRY_ID)
+    hass.data = {DOMAIN: {ENTRY_ID: SimpleNamespace(api=api,
+                                                    coverCache=coverCache,
+                                                    library=MagicMock(),
+                                                    prefetcher=MagicMock())}}
+    entry = SimpleNamespace(entry_id=ENTRY_ID, title="Subsonic", data={}, options={})
+
+    return SubsonicServerSource(hass, entry), coverCache
+
+
+def test_album_listing_signs_each_cover_once() -> None:
+    album = {
+        "id": "al-1",
+        "name": "Album",
+        "coverArt": "al-1",
+        "songs": [{"id": f"tr-{i}", "title": f"Track {i}", "coverArt": "al-1" if i < 8 else "tr-8"}
+                  for i in range(10)] + [{"id": "tr-10", "title": "Track 10"}],
+    }
+    source, coverCache = _makeSource(album)
+
+    with patch.object(coverCache, "sign", wraps=coverCache.sign) as sign:
+        result = asyncio.run(source.async_browse_media("album/al-1"))
+
+    assert Counter(call.args[0] for call in sign.call_args_list) == {"al-1": 1, "tr-8": 1}
+    assert len(result.children) == 11
+    assert result.children[0].thumbnail == result.thumbnail
+    assert result.children[8].thumbnail != result.thumbnail
+    assert result.children[10].thumbnail == result.thumbnail
+
+
+def test_search_merges_local_index_and_server() -> None:
+    album = Album.fromDict({"id": "al-1", "name": "Help!"})
+    songs = [Song.fromDict({"id": f"tr-{i}", "title": f"Help {i}"}) for i in range(3)]
+    source, _ = _makeSource()
+    source.library.search.return_value = SearchResult(albums=[album], songs=songs[:1])
+    source.api.search = AsyncMock(return_value=SearchResult(albums=[album], songs=songs))
+
+    result = asyncio.run(source.async_browse_media("search/help"))
+
+    assert [child.identifier for child in result.children] == [
+        f"{ENTRY_ID}/album/al-1",
+        f"{ENTRY_ID}/song/tr-0",
+        f"{ENTRY_ID}/song/tr-1",
+        f"{ENTRY_ID}/song/tr-2",
+    ]
+
+
+def test_debounced_searches_share_the_latest_result() -> None:
+    source, _ = _makeSource()
+    source.library.search.return_value = SearchResult()
+    source.api.search = AsyncMock(return_value=SearchResult(albums=[Album.fromDict({"id": "al-1", "name": "Help!"})]))
+
+    async def typeahead():
+        searches = []
+
+        for query in ("h", "he", "help"):
+            searches.append(asyncio.create_task(source.async_search_media(SearchMediaQuery(search_query=query))))
+            await asyncio.sleep(0)
+
+        return await asyncio.gather(*searches)
+
+    with patch("custom_components.subsonic.media_source.SEARCH_DEBOUNCE", 0.01):
+        results = asyncio.run(typeahead())
+
+    source.api.search.assert_awaited_once()
+    assert source.api.search.await_args.args[0] == "help"
+    assert [[child.identifier for child in result.result] for result in results] == [[f"{ENTRY_ID}/album/al-1"]] * 3